@@ -7,47 +7,56 @@ Ce script permet de lancer différents scénarios de simulation
 et d'analyser les résultats.
 """
 
-import random
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
+
 # Import des modules
-from src.core import SimulationEngine
+from src.core import SimulationEngine, Server, JobGenerator
 from src.capacity import WaterfallScenario, LimitedQueue
 from src.reliability import (
     SystematicBackup, RandomBackup, ReliableServer, BackupComparison
 )
 from src.regulation import ChannelsScenario
 from src.analysis import (
-    WarmupDetector, PerformanceAnalyzer, Visualizer, RealDataComparator
+    WarmupDetector, ConfidenceInterval, PerformanceAnalyzer, Visualizer,
+    RealDataComparator
 )
 
 
-def scenario_basic(duration: float = 1000.0, seed: int = 42):
+# Paramètres du scénario basique (λ, μ, c)
+BASIC_PARAMS = (2.0, 3.0, 1)
+
+# Paramètres du scénario Channels: (type, λ, μ) par population
+CHANNELS_POPULATIONS = (("ING", 1.5, 2.5), ("PREPA", 0.5, 2.0))
+CHANNELS_NUM_SERVERS = 2
+
+
+def _simulate_basic(duration: float,
+                    seed: int,
+                    arrival_rate: float,
+                    service_rate: float,
+                    num_servers: int,
+                    as_arrays: bool = False):
     """
-    Scénario basique: file M/M/c simple
+    Simule une file M/M/c et retourne les événements
     
     Args:
         duration: Durée de la simulation
         seed: Graine aléatoire
+        arrival_rate: Taux d'arrivée λ
+        service_rate: Taux de service μ
+        num_servers: Nombre de serveurs c
+        as_arrays: Retourne les colonnes NumPy (get_results_soa) plutôt
+            que le DataFrame
     """
-    print("=== SCÉNARIO BASIQUE: M/M/c ===\n")
-    
-    # Paramètres
-    arrival_rate = 2.0  # λ = 2 jobs/unité
-    service_rate = 3.0  # μ = 3 jobs/unité  
-    num_servers = 1
-    
-    print(f"Paramètres:")
-    print(f"  λ (arrivées): {arrival_rate}")
-    print(f"  μ (service): {service_rate}")
-    print(f"  c (serveurs): {num_servers}")
-    print(f"  ρ (utilisation théorique): {arrival_rate/(service_rate*num_servers):.2f}\n")
-    
-    # Initialisation
+    # Arrivées et services tirés par blocs sur le générateur du moteur:
+    # reproductible par graine, même lorsque plusieurs simulations
+    # tournent dans des processus du pool
     engine = SimulationEngine(random_seed=seed)
     
-    from src.core import Server, JobGenerator
     server = Server(
         env=engine.env,
         server_id="basic_server",
@@ -59,18 +68,91 @@ def scenario_basic(duration: float = 1000.0, seed: int = 42):
         env=engine.env,
         logger=engine.logger,
         arrival_rate=arrival_rate,
-        job_type="ING"
+        job_type="ING",
+        rng=engine.rng
     )
     
-    # Lancement
-    def service_time_gen():
-        return random.expovariate(service_rate)
+    # Lancement (temps de service tirés par blocs)
+    service_time_gen = partial(next, engine.exp_stream(service_rate))
     
     engine.env.process(generator.generate(server, service_time_gen, duration))
     engine.run(duration)
     
+    return engine.get_results_soa() if as_arrays else engine.get_results()
+
+
+def _run_basic_replication(seed: int, duration: float) -> dict:
+    """
+    Exécute une réplication du scénario basique (fonction de niveau module
+    pour pouvoir être envoyée à un processus du pool)
+    
+    Args:
+        seed: Graine de la réplication
+        duration: Durée de la simulation
+        
+    Returns:
+        Métriques principales de la réplication
+    """
+    arrival_rate, service_rate, num_servers = BASIC_PARAMS
+    results = _simulate_basic(duration, seed, arrival_rate, service_rate, num_servers,
+                              as_arrays=True)
+    summary = PerformanceAnalyzer(results).get_summary(num_servers)
+    
+    return {
+        'throughput': summary['throughput'],
+        'utilization': summary['utilization'],
+        'mean_waiting_time': summary['waiting_time']['mean'],
+        'mean_response_time': summary['response_time']['mean']
+    }
+
+
+def scenario_replications(runs: int, duration: float = 1000.0, seed: int = 42):
+    """
+    Réplications indépendantes du scénario basique, exécutées en parallèle,
+    avec intervalles de confiance à 95% sur les métriques principales
+    
+    Args:
+        runs: Nombre de réplications (graines seed, seed+1, ...)
+        duration: Durée de chaque simulation
+        seed: Graine de la première réplication
+    """
+    print(f"=== RÉPLICATIONS: {runs} exécutions du scénario basique ===\n")
+    
+    seeds = range(seed, seed + runs)
+    with ProcessPoolExecutor() as pool:
+        results = list(pool.map(partial(_run_basic_replication, duration=duration), seeds))
+    
+    print("Intervalles de confiance (95%):")
+    for metric in ('throughput', 'utilization', 'mean_waiting_time', 'mean_response_time'):
+        mean, low, high = ConfidenceInterval.calculate_multiple_runs_ci(results, metric)
+        print(f"  {metric}: {mean:.4f} [{low:.4f}, {high:.4f}]")
+    print()
+    
+    return results
+
+
+def scenario_basic(duration: float = 1000.0, seed: int = 42):
+    """
+    Scénario basique: file M/M/c simple
+    
+    Args:
+        duration: Durée de la simulation
+        seed: Graine aléatoire
+    """
+    print("=== SCÉNARIO BASIQUE: M/M/c ===\n")
+    
+    # Paramètres
+    arrival_rate, service_rate, num_servers = BASIC_PARAMS  # λ = 2, μ = 3 jobs/unité
+    
+    print(f"Paramètres:")
+    print(f"  λ (arrivées): {arrival_rate}")
+    print(f"  μ (service): {service_rate}")
+    print(f"  c (serveurs): {num_servers}")
+    print(f"  ρ (utilisation théorique): {arrival_rate/(service_rate*num_servers):.2f}\n")
+    
+    df = _simulate_basic(duration, seed, arrival_rate, service_rate, num_servers)
+    
     # Analyse
-    df = engine.get_results()
     analyzer = PerformanceAnalyzer(df)
     summary = analyzer.get_summary(num_servers)
     
@@ -116,7 +198,7 @@ def scenario_waterfall(duration: float = 1000.0, seed: int = 42):
     )
     
     # Exécution
-    results = scenario.run_comparison(arrival_rate, service_rate, duration)
+    results = scenario.run_comparison(arrival_rate, service_rate, duration, mode='both')
     
     print("Résultats File Limitée:")
     print(f"  Arrivées: {results['limited_queue']['total_arrivals']}")
@@ -130,6 +212,10 @@ def scenario_waterfall(duration: float = 1000.0, seed: int = 42):
     print(f"  Rejets: {results['loss_system']['total_rejections']}")
     print(f"  Prob. blocage: {results['loss_system']['blocking_probability']:.2%}\n")
     
+    print("Valeurs théoriques (M/M/c/K, Erlang B):")
+    print(f"  Taux de rejet file: {results['analytic']['queue_rejection_rate']:.2%}")
+    print(f"  Prob. blocage loss: {results['analytic']['loss_blocking_probability']:.2%}\n")
+    
     print("Comparaison:")
     print(f"  Avantage file: +{results['comparison']['queue_advantage']} jobs\n")
     
@@ -160,10 +246,10 @@ def scenario_backup(duration: float = 1000.0, seed: int = 42):
     
     # Initialisation
     engine = SimulationEngine(random_seed=seed)
-    comparison = BackupComparison(env=engine.env, logger=engine.logger)
+    comparison = BackupComparison(env=engine.env, logger=engine.logger, rng=engine.rng)
     
-    def backup_time_gen():
-        return random.expovariate(backup_rate)
+    # Temps de backup tirés par blocs
+    backup_time_gen = partial(next, engine.exp_stream(backup_rate))
     
     # Ajout des stratégies
     comparison.add_server(
@@ -176,14 +262,14 @@ def scenario_backup(duration: float = 1000.0, seed: int = 42):
     comparison.add_server(
         "random_50%",
         num_servers,
-        RandomBackup(0.5),
+        RandomBackup(0.5, rng=engine.rng),
         backup_time_gen
     )
     
     comparison.add_server(
         "random_20%",
         num_servers,
-        RandomBackup(0.2),
+        RandomBackup(0.2, rng=engine.rng),
         backup_time_gen
     )
     
@@ -200,6 +286,35 @@ def scenario_backup(duration: float = 1000.0, seed: int = 42):
     return engine.get_results(), results
 
 
+def _run_one_policy(policy: str, seed: int, duration: float):
+    """
+    Simule le scénario Channels pour une politique d'ordonnancement
+    (fonction de niveau module pour pouvoir être envoyée à un processus du pool)
+    
+    Args:
+        policy: Politique d'ordonnancement ("FIFO", "SJF", "PRIORITY")
+        seed: Graine aléatoire
+        duration: Durée de la simulation
+        
+    Returns:
+        Tuple (politique, statistiques)
+    """
+    engine = SimulationEngine(random_seed=seed)
+    scenario = ChannelsScenario(
+        env=engine.env,
+        logger=engine.logger,
+        num_servers=CHANNELS_NUM_SERVERS,
+        scheduling_policy=policy,
+        rng=engine.rng
+    )
+    
+    for population_type, arrival_rate, service_rate in CHANNELS_POPULATIONS:
+        scenario.add_population(population_type, arrival_rate, service_rate)
+    
+    # Boucle d'événements propre au serveur (mêmes résultats que SimPy)
+    return policy, scenario.run(duration, native=True)
+
+
 def scenario_channels(duration: float = 1000.0, seed: int = 42):
     """
     Scénario Channels: populations hétérogènes ING/PREPA
@@ -210,39 +325,22 @@ def scenario_channels(duration: float = 1000.0, seed: int = 42):
     """
     print("=== SCÉNARIO CHANNELS: Populations Hétérogènes ===\n")
     
-    # Paramètres
-    lambda_ing = 1.5
-    lambda_prepa = 0.5
-    mu_ing = 2.5
-    mu_prepa = 2.0
-    num_servers = 2
-    
     print(f"Paramètres:")
-    print(f"  Population ING: λ={lambda_ing}, μ={mu_ing}")
-    print(f"  Population PREPA: λ={lambda_prepa}, μ={mu_prepa}")
-    print(f"  Serveurs: {num_servers}\n")
+    for population_type, arrival_rate, service_rate in CHANNELS_POPULATIONS:
+        print(f"  Population {population_type}: λ={arrival_rate}, μ={service_rate}")
+    print(f"  Serveurs: {CHANNELS_NUM_SERVERS}\n")
     
-    # Test avec différentes politiques
+    # Test avec différentes politiques, simulées en parallèle
     policies = ["FIFO", "SJF", "PRIORITY"]
-    results = {}
     
-    for policy in policies:
+    with ProcessPoolExecutor(max_workers=len(policies)) as pool:
+        results = dict(pool.map(
+            partial(_run_one_policy, seed=seed, duration=duration),
+            policies
+        ))
+    
+    for policy, stats in results.items():
         print(f"--- Politique: {policy} ---")
-        
-        engine = SimulationEngine(random_seed=seed)
-        scenario = ChannelsScenario(
-            env=engine.env,
-            logger=engine.logger,
-            num_servers=num_servers,
-            scheduling_policy=policy
-        )
-        
-        scenario.add_population("ING", lambda_ing, mu_ing)
-        scenario.add_population("PREPA", lambda_prepa, mu_prepa)
-        
-        stats = scenario.run(duration)
-        results[policy] = stats
-        
         print(f"  ING - Complétés: {stats['by_type']['ING']['completed']}, "
               f"Temps réponse: {stats['by_type']['ING']['avg_response_time']:.4f}")
         print(f"  PREPA - Complétés: {stats['by_type']['PREPA']['completed']}, "
@@ -280,9 +378,9 @@ def scenario_real_data(tags_file: str, duration: float = 1000.0, seed: int = 42)
     print(f"  μ: {service_rate:.6f}")
     print(f"  c: {num_servers}\n")
     
+    # Générateur du moteur (voir _simulate_basic)
     engine = SimulationEngine(random_seed=seed)
     
-    from src.core import Server, JobGenerator
     server = Server(
         env=engine.env,
         server_id="real_data_server",
@@ -294,11 +392,12 @@ def scenario_real_data(tags_file: str, duration: float = 1000.0, seed: int = 42)
         env=engine.env,
         logger=engine.logger,
         arrival_rate=arrival_rate,
-        job_type="ING"
+        job_type="ING",
+        rng=engine.rng
     )
     
-    def service_time_gen():
-        return random.expovariate(service_rate)
+    # Temps de service tirés par blocs
+    service_time_gen = partial(next, engine.exp_stream(service_rate))
     
     engine.env.process(generator.generate(server, service_time_gen, duration))
     engine.run(duration)
@@ -334,6 +433,9 @@ def main():
                        help='Répertoire de sortie pour les graphiques')
     parser.add_argument('--visualize', action='store_true',
                        help='Générer les visualisations')
+    parser.add_argument('--runs', type=int, default=1,
+                       help='Nombre de réplications indépendantes en parallèle '
+                            '(scénario basic, avec intervalles de confiance)')
     
     args = parser.parse_args()
     
@@ -345,7 +447,9 @@ def main():
     df = None
     results = None
     
-    if args.scenario == 'basic':
+    if args.scenario == 'basic' and args.runs > 1:
+        results = scenario_replications(args.runs, args.duration, args.seed)
+    elif args.scenario == 'basic':
         df, results = scenario_basic(args.duration, args.seed)
     elif args.scenario == 'waterfall':
         df, results = scenario_waterfall(args.duration, args.seed)
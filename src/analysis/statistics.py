@@ -11,11 +11,103 @@ Ce module implémente:
 
 import pandas as pd
 import numpy as np
-from scipy import stats
 from typing import Dict, List, Tuple, Optional
-import matplotlib.pyplot as plt
-import seaborn as sns
 from datetime import datetime
+from functools import lru_cache
+
+# scipy.stats, matplotlib et seaborn sont importés à la demande dans les
+# méthodes qui les utilisent: leur chargement coûte plusieurs centaines de
+# millisecondes, inutiles pour une simulation sans visualisation.
+
+
+def _category_codes(column: pd.Series) -> Tuple[np.ndarray, Dict[str, int]]:
+    """
+    Encode une colonne de chaînes en codes entiers via pd.Categorical
+    
+    Les filtres se font ensuite par comparaison d'entiers (int8) plutôt
+    que par comparaison de chaînes ligne à ligne.
+    
+    Args:
+        column: Colonne à encoder (event_type, entity_type...)
+        
+    Returns:
+        Tuple (codes, {valeur: code})
+    """
+    categorical = column.astype('category')
+    codes = categorical.cat.codes.to_numpy()
+    index = {value: code for code, value in enumerate(categorical.cat.categories)}
+    return codes, index
+
+
+@lru_cache(maxsize=256)
+def _t_ppf(confidence: float, df: int) -> float:
+    """Quantile bilatéral de Student, mémorisé par (confiance, ddl)"""
+    from scipy.stats import t
+    return float(t.ppf((1 + confidence) / 2, df))
+
+
+@lru_cache(maxsize=16)
+def _z_ppf(confidence: float) -> float:
+    """Quantile bilatéral de la loi normale, mémorisé par confiance"""
+    from scipy.stats import norm
+    return float(norm.ppf((1 + confidence) / 2))
+
+
+def _mean_sem(data) -> Tuple[float, float]:
+    """
+    Moyenne et erreur standard (ddof=1) calculées ensemble
+    
+    Équivalent à (np.mean(data), scipy.stats.sem(data)) sans l'appel à
+    SciPy: les écarts à la moyenne sont réduits par un produit scalaire,
+    sans tableau intermédiaire des carrés.
+    
+    Args:
+        data: Données à analyser (non vides)
+        
+    Returns:
+        Tuple (moyenne, erreur standard), erreur NaN si une seule valeur
+    """
+    values = np.asarray(data, dtype=np.float64)
+    n = values.size
+    mean = values.sum() / n
+    
+    if n < 2:
+        return mean, np.nan
+    
+    deviations = values - mean
+    return mean, np.sqrt(np.dot(deviations, deviations) / ((n - 1) * n))
+
+
+def _arrays_to_dataframe(results: Dict) -> pd.DataFrame:
+    """
+    Construit un DataFrame à partir des colonnes NumPy d'une simulation
+    (SimulationEngine.get_results_soa)
+    
+    Les codes entiers deviennent des colonnes catégorielles sans repasser
+    par les chaînes: _category_codes retrouve directement ces codes.
+    
+    Args:
+        results: Dictionnaire {colonne: tableau} avec event_names/entity_names
+        
+    Returns:
+        DataFrame des événements
+    """
+    def categorical(codes, names):
+        categories = [names[code] for code in range(len(names))]
+        return pd.Categorical.from_codes(codes, categories=categories)
+    
+    queue_length = results['queue_length'].astype(np.float64)
+    queue_length[results['queue_length'] < 0] = np.nan
+    
+    return pd.DataFrame({
+        'time': results['time'],
+        'event_type': categorical(results['event_code'], results['event_names']),
+        'entity_type': categorical(results['entity_code'], results['entity_names']),
+        'queue_length': queue_length,
+        'waiting_time': results['waiting_time'],
+        'response_time': results['response_time'],
+        'service_time': results['service_time']
+    })
 
 
 class WarmupDetector:
@@ -41,20 +133,61 @@ class WarmupDetector:
         if len(data) < window_size * 2:
             return 0
         
-        # Calcul de la moyenne mobile
-        rolling_mean = data.rolling(window=window_size).mean()
-        
-        # Calcul du coefficient de variation
-        rolling_std = data.rolling(window=window_size).std()
-        cv = rolling_std / rolling_mean
+        arr = np.ascontiguousarray(np.asarray(data, dtype=np.float64))
+        cv = WarmupDetector._rolling_cv(arr, window_size)
         
-        # Trouve le premier point où le CV devient stable
-        for i in range(window_size, len(cv)):
-            if cv[i] < threshold:
-                return max(0, i - window_size)
+        # Trouve le premier point où le CV devient stable: argmax sur le
+        # masque booléen retourne l'index du premier True (décalé de window_size)
+        stable = cv[window_size:] < threshold
+        if stable.any():
+            return int(np.argmax(stable))
         
         return window_size
     
+    @staticmethod
+    def _rolling_cv(arr: np.ndarray, window_size: int) -> np.ndarray:
+        """
+        Coefficient de variation sur fenêtre glissante, par sommes cumulées
+        
+        Équivalent à data.rolling(window).std() / data.rolling(window).mean():
+        chaque fenêtre est mise à jour en O(1) (sum += x[i] - x[i-w]) au lieu
+        d'être recalculée. Les fenêtres contenant un NaN donnent NaN.
+        
+        Args:
+            arr: Données (float64)
+            window_size: Taille de la fenêtre
+            
+        Returns:
+            Tableau des CV, NaN pour les window_size - 1 premiers points
+        """
+        n = len(arr)
+        cv = np.full(n, np.nan)
+        
+        missing = np.isnan(arr)
+        # Centrage pour limiter les erreurs d'arrondi de sumsq - sum²/w
+        shift = np.mean(arr[~missing]) if not missing.all() else 0.0
+        centered = np.where(missing, 0.0, arr - shift)
+        
+        csum = np.concatenate(([0.0], np.cumsum(centered)))
+        csumsq = np.concatenate(([0.0], np.cumsum(centered * centered)))
+        cmiss = np.concatenate(([0], np.cumsum(missing)))
+        
+        win_sum = csum[window_size:] - csum[:-window_size]
+        win_sumsq = csumsq[window_size:] - csumsq[:-window_size]
+        win_missing = cmiss[window_size:] - cmiss[:-window_size]
+        
+        # Variance corrigée (ddof=1) comme pandas.rolling().std()
+        var = (win_sumsq - win_sum * win_sum / window_size) / (window_size - 1)
+        std = np.sqrt(np.maximum(var, 0.0))
+        mean = win_sum / window_size + shift
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            window_cv = std / mean
+        window_cv[win_missing > 0] = np.nan
+        
+        cv[window_size - 1:] = window_cv
+        return cv
+    
     @staticmethod
     def remove_warmup(df: pd.DataFrame, warmup_time: float) -> pd.DataFrame:
         """
@@ -91,16 +224,15 @@ class ConfidenceInterval:
         if len(data) == 0:
             return 0.0, 0.0, 0.0
         
-        mean = np.mean(data)
-        std_error = stats.sem(data)
+        mean, std_error = _mean_sem(data)
         
-        # T-test pour petit échantillon
+        # T-test pour petit échantillon (quantiles mémorisés: les campagnes
+        # de réplications recalculent les mêmes valeurs)
         if len(data) < 30:
-            df = len(data) - 1
-            t_value = stats.t.ppf((1 + confidence) / 2, df)
+            t_value = _t_ppf(confidence, len(data) - 1)
         else:
             # Z-test pour grand échantillon
-            t_value = stats.norm.ppf((1 + confidence) / 2)
+            t_value = _z_ppf(confidence)
         
         margin = t_value * std_error
         
@@ -121,8 +253,8 @@ class ConfidenceInterval:
         Returns:
             Tuple (moyenne, borne_inf, borne_sup)
         """
-        values = [r[metric] for r in results if metric in r]
-        return ConfidenceInterval.calculate_ci(np.array(values), confidence)
+        values = np.fromiter((r[metric] for r in results if metric in r), dtype=np.float64)
+        return ConfidenceInterval.calculate_ci(values, confidence)
 
 
 class PerformanceAnalyzer:
@@ -130,12 +262,62 @@ class PerformanceAnalyzer:
     Analyse des performances du système
     """
     
-    def __init__(self, df: pd.DataFrame):
+    def __init__(self, df):
         """
         Args:
-            df: DataFrame contenant les événements de simulation
+            df: DataFrame contenant les événements de simulation, ou
+                colonnes NumPy retournées par SimulationEngine.get_results_soa
+            
+        Les lignes 'end_service' ont toujours des colonnes waiting_time et
+        response_time renseignées (tous les serveurs les journalisent à la
+        fin du service): les statistiques travaillent donc directement sur
+        ces colonnes, sans passe dropna.
         """
+        if isinstance(df, dict):
+            df = _arrays_to_dataframe(df)
         self.df = df
+        
+        # Codes entiers des types d'événements et nombre d'événements par
+        # type, comptés en une seule passe (bincount)
+        self._codes = np.empty(0, dtype=np.int8)
+        self._index: Dict[str, int] = {}
+        self._counts: Dict[str, int] = {}
+        if not df.empty:
+            self._codes, self._index = _category_codes(df['event_type'])
+            counts = np.bincount(self._codes[self._codes >= 0], minlength=len(self._index))
+            self._counts = {
+                event_type: int(counts[code])
+                for event_type, code in self._index.items()
+            }
+        
+        # Sous-DataFrames construits à la demande: seuls les jobs terminés
+        # sont réellement nécessaires, les autres types ne servent qu'à compter
+        self._by_type: Dict[str, pd.DataFrame] = {}
+        self._completed = self._get_events('end_service')
+    
+    def _get_events(self, event_type: str) -> pd.DataFrame:
+        """
+        Retourne les événements d'un type donné
+        
+        Args:
+            event_type: Type d'événement ('arrival', 'end_service', ...)
+            
+        Returns:
+            Sous-DataFrame (vide si aucun événement de ce type)
+        """
+        events = self._by_type.get(event_type)
+        if events is None:
+            code = self._index.get(event_type)
+            if code is None:
+                events = self.df.iloc[0:0]
+            else:
+                events = self.df[self._codes == code]
+            self._by_type[event_type] = events
+        return events
+    
+    def _count_events(self, event_type: str) -> int:
+        """Retourne le nombre d'événements d'un type donné"""
+        return self._counts.get(event_type, 0)
     
     def calculate_throughput(self, time_window: Optional[float] = None) -> float:
         """
@@ -147,17 +329,17 @@ class PerformanceAnalyzer:
         Returns:
             Débit moyen
         """
-        completed = self.df[self.df['event_type'] == 'end_service']
+        num_completed = self._count_events('end_service')
         
-        if len(completed) == 0:
+        if num_completed == 0:
             return 0.0
         
-        total_time = time_window if time_window else completed['time'].max()
+        total_time = time_window if time_window else self._completed['time'].max()
         
         if total_time == 0:
             return 0.0
         
-        return len(completed) / total_time
+        return num_completed / total_time
     
     def calculate_utilization(self, num_servers: int) -> float:
         """
@@ -169,7 +351,7 @@ class PerformanceAnalyzer:
         Returns:
             Taux d'utilisation (0 à 1)
         """
-        completed = self.df[self.df['event_type'] == 'end_service']
+        completed = self._completed
         
         if len(completed) == 0:
             return 0.0
@@ -189,25 +371,7 @@ class PerformanceAnalyzer:
         Returns:
             Dictionnaire avec moyenne, médiane, percentiles
         """
-        completed = self.df[self.df['event_type'] == 'end_service']
-        waiting_times = completed['waiting_time'].dropna()
-        
-        if len(waiting_times) == 0:
-            return {
-                'mean': 0.0,
-                'median': 0.0,
-                'p95': 0.0,
-                'p99': 0.0,
-                'std': 0.0
-            }
-        
-        return {
-            'mean': waiting_times.mean(),
-            'median': waiting_times.median(),
-            'p95': waiting_times.quantile(0.95),
-            'p99': waiting_times.quantile(0.99),
-            'std': waiting_times.std()
-        }
+        return self._distribution_stats('waiting_time')
     
     def calculate_response_time_stats(self) -> Dict[str, float]:
         """
@@ -216,10 +380,24 @@ class PerformanceAnalyzer:
         Returns:
             Dictionnaire avec moyenne, médiane, percentiles
         """
-        completed = self.df[self.df['event_type'] == 'end_service']
-        response_times = completed['response_time'].dropna()
+        return self._distribution_stats('response_time')
+    
+    def _distribution_stats(self, column: str) -> Dict[str, float]:
+        """
+        Moyenne, médiane, percentiles et écart-type d'une colonne des jobs terminés
+        
+        Les trois quantiles sont obtenus en un seul appel à np.quantile
+        (une seule sélection partielle) au lieu d'un tri par statistique.
+        
+        Args:
+            column: Colonne à analyser ('waiting_time', 'response_time')
+            
+        Returns:
+            Dictionnaire avec moyenne, médiane, percentiles
+        """
+        values = self._completed[column].to_numpy(dtype=np.float64, copy=False)
         
-        if len(response_times) == 0:
+        if len(values) == 0:
             return {
                 'mean': 0.0,
                 'median': 0.0,
@@ -228,12 +406,15 @@ class PerformanceAnalyzer:
                 'std': 0.0
             }
         
+        median, p95, p99 = np.quantile(values, [0.5, 0.95, 0.99])
+        
         return {
-            'mean': response_times.mean(),
-            'median': response_times.median(),
-            'p95': response_times.quantile(0.95),
-            'p99': response_times.quantile(0.99),
-            'std': response_times.std()
+            'mean': values.mean(),
+            'median': median,
+            'p95': p95,
+            'p99': p99,
+            # Écart-type corrigé (ddof=1), comme pandas.Series.std()
+            'std': values.std(ddof=1) if len(values) > 1 else np.nan
         }
     
     def calculate_rejection_rate(self) -> float:
@@ -243,8 +424,8 @@ class PerformanceAnalyzer:
         Returns:
             Taux de rejet (0 à 1)
         """
-        arrivals = len(self.df[self.df['event_type'] == 'arrival'])
-        rejections = len(self.df[self.df['event_type'] == 'rejection'])
+        arrivals = self._count_events('arrival')
+        rejections = self._count_events('rejection')
         
         if arrivals == 0:
             return 0.0
@@ -275,113 +456,184 @@ class Visualizer:
     Visualisation des résultats de simulation
     """
     
+    # Style seaborn appliqué une seule fois par processus
+    _styled = False
+    
     def __init__(self, df: pd.DataFrame):
         """
         Args:
             df: DataFrame contenant les événements
         """
         self.df = df
-        sns.set_style("whitegrid")
+        self._event_codes, self._event_index = _category_codes(df['event_type'])
+        self._completed = self._get_events('end_service')
+        
+        if not Visualizer._styled:
+            import seaborn as sns
+            sns.set_style("whitegrid")
+            Visualizer._styled = True
     
-    def plot_arrivals_over_time(self, save_path: Optional[str] = None):
+    def _get_events(self, event_type: str) -> pd.DataFrame:
         """
-        Graphique des arrivées au cours du temps
+        Retourne les événements d'un type donné
         
         Args:
-            save_path: Chemin pour sauvegarder la figure
+            event_type: Type d'événement ('arrival', 'end_service', ...)
         """
-        arrivals = self.df[self.df['event_type'] == 'arrival']
+        code = self._event_index.get(event_type, -1)
+        return self.df[self._event_codes == code]
+    
+    @staticmethod
+    def _new_axes(figsize: Tuple[float, float] = (12, 6)):
+        """Crée une figure pyplot et retourne ses axes"""
+        import matplotlib.pyplot as plt
+        _, ax = plt.subplots(figsize=figsize)
+        return ax
+    
+    @staticmethod
+    def _finish_plot(ax, save_path: Optional[str], own_figure: bool):
+        """
+        Sauvegarde (ou affiche) le graphique dessiné sur `ax`
         
-        plt.figure(figsize=(12, 6))
-        plt.plot(arrivals['time'], range(1, len(arrivals) + 1))
-        plt.xlabel('Temps (unités)')
-        plt.ylabel('Nombre cumulé d\'arrivées')
-        plt.title('Arrivées au cours du temps')
-        plt.grid(True, alpha=0.3)
+        Args:
+            ax: Axes du graphique
+            save_path: Chemin pour sauvegarder la figure
+            own_figure: True si la figure a été créée par la méthode de tracé,
+                        False si les axes sont fournis et réutilisés par l'appelant
+        """
+        import matplotlib.pyplot as plt
         
+        # Marges ajustées une fois avant l'export: bbox_inches='tight'
+        # imposerait un second rendu complet de la figure à chaque sauvegarde
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            ax.figure.tight_layout()
+            ax.figure.savefig(save_path, dpi=150)
+        
+        if own_figure:
+            if not save_path:
+                plt.show()
+            plt.close(ax.figure)
         else:
-            plt.show()
-        plt.close()
+            # Les axes sont vidés pour le graphique suivant
+            ax.clear()
     
-    def plot_queue_length_over_time(self, save_path: Optional[str] = None):
+    @staticmethod
+    def _plot_histogram(ax, values, bins: int, **bar_kwargs):
         """
-        Graphique de la longueur de file au cours du temps
+        Histogramme calculé par np.histogram puis tracé en un seul ax.bar
+        
+        Évite le binning de ax.hist sur de grands tableaux.
+        
+        Args:
+            ax: Axes du graphique
+            values: Valeurs à répartir (sans NaN)
+            bins: Nombre de classes
+            bar_kwargs: Options de style transmises à ax.bar
+        """
+        values = np.asarray(values, dtype=np.float64)
+        counts, edges = np.histogram(values, bins=bins)
+        ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge', **bar_kwargs)
+    
+    def plot_arrivals_over_time(self, save_path: Optional[str] = None, ax=None):
+        """
+        Graphique des arrivées au cours du temps
         
         Args:
             save_path: Chemin pour sauvegarder la figure
+            ax: Axes matplotlib à réutiliser (une nouvelle figure si None)
         """
-        plt.figure(figsize=(12, 6))
-        plt.plot(self.df['time'], self.df['queue_length'])
-        plt.xlabel('Temps (unités)')
-        plt.ylabel('Longueur de la file')
-        plt.title('Évolution de la longueur de file')
-        plt.grid(True, alpha=0.3)
+        times = self._get_events('arrival')['time'].to_numpy(dtype=np.float64, copy=False)
+        counts = np.arange(1, times.size + 1, dtype=np.int32)
         
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        else:
-            plt.show()
-        plt.close()
+        # Au-delà de ~50k points la courbe est visuellement identique:
+        # on n'en trace qu'un sur `step`
+        step = max(1, times.size // 50000)
+        
+        own_figure = ax is None
+        if own_figure:
+            ax = self._new_axes()
+        ax.plot(times[::step], counts[::step])
+        ax.set_xlabel('Temps (unités)')
+        ax.set_ylabel('Nombre cumulé d\'arrivées')
+        ax.set_title('Arrivées au cours du temps')
+        ax.grid(True, alpha=0.3)
+        
+        self._finish_plot(ax, save_path, own_figure)
     
-    def plot_waiting_time_distribution(self, save_path: Optional[str] = None):
+    def plot_queue_length_over_time(self, save_path: Optional[str] = None, ax=None):
         """
-        Distribution des temps d'attente
+        Graphique de la longueur de file au cours du temps
         
         Args:
             save_path: Chemin pour sauvegarder la figure
+            ax: Axes matplotlib à réutiliser (une nouvelle figure si None)
+        """
+        own_figure = ax is None
+        if own_figure:
+            ax = self._new_axes()
+        ax.plot(self.df['time'], self.df['queue_length'])
+        ax.set_xlabel('Temps (unités)')
+        ax.set_ylabel('Longueur de la file')
+        ax.set_title('Évolution de la longueur de file')
+        ax.grid(True, alpha=0.3)
+        
+        self._finish_plot(ax, save_path, own_figure)
+    
+    def plot_waiting_time_distribution(self, save_path: Optional[str] = None, ax=None):
         """
-        completed = self.df[self.df['event_type'] == 'end_service']
-        waiting_times = completed['waiting_time'].dropna()
+        Distribution des temps d'attente
         
-        plt.figure(figsize=(12, 6))
-        plt.hist(waiting_times, bins=50, edgecolor='black', alpha=0.7)
-        plt.xlabel('Temps d\'attente (unités)')
-        plt.ylabel('Fréquence')
-        plt.title('Distribution des temps d\'attente')
-        plt.axvline(waiting_times.mean(), color='red', linestyle='--', 
+        Args:
+            save_path: Chemin pour sauvegarder la figure
+            ax: Axes matplotlib à réutiliser (une nouvelle figure si None)
+        """
+        waiting_times = self._completed['waiting_time'].to_numpy(dtype=np.float64, copy=False)
+        
+        own_figure = ax is None
+        if own_figure:
+            ax = self._new_axes()
+        self._plot_histogram(ax, waiting_times, bins=50, edgecolor='black', alpha=0.7)
+        ax.set_xlabel('Temps d\'attente (unités)')
+        ax.set_ylabel('Fréquence')
+        ax.set_title('Distribution des temps d\'attente')
+        ax.axvline(waiting_times.mean(), color='red', linestyle='--', 
                    label=f'Moyenne: {waiting_times.mean():.2f}')
-        plt.legend()
-        plt.grid(True, alpha=0.3)
+        ax.legend()
+        ax.grid(True, alpha=0.3)
         
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        else:
-            plt.show()
-        plt.close()
+        self._finish_plot(ax, save_path, own_figure)
     
-    def plot_response_time_by_type(self, save_path: Optional[str] = None):
+    def plot_response_time_by_type(self, save_path: Optional[str] = None, ax=None):
         """
         Temps de réponse par type de job
         
         Args:
             save_path: Chemin pour sauvegarder la figure
+            ax: Axes matplotlib à réutiliser (une nouvelle figure si None)
         """
-        completed = self.df[self.df['event_type'] == 'end_service']
+        own_figure = ax is None
+        if own_figure:
+            ax = self._new_axes()
         
-        plt.figure(figsize=(12, 6))
+        # Un seul groupby (passe hachée) plutôt qu'un masque par type de job
+        groups = self._completed.groupby('entity_type', sort=False, observed=True)
+        for job_type, group in groups['response_time']:
+            data = group.to_numpy(dtype=np.float64, copy=False)
+            self._plot_histogram(ax, data, bins=30, alpha=0.5, label=job_type, edgecolor='black')
         
-        for job_type in completed['entity_type'].unique():
-            data = completed[completed['entity_type'] == job_type]['response_time']
-            plt.hist(data, bins=30, alpha=0.5, label=job_type, edgecolor='black')
+        ax.set_xlabel('Temps de réponse (unités)')
+        ax.set_ylabel('Fréquence')
+        ax.set_title('Distribution des temps de réponse par type')
+        ax.legend()
+        ax.grid(True, alpha=0.3)
         
-        plt.xlabel('Temps de réponse (unités)')
-        plt.ylabel('Fréquence')
-        plt.title('Distribution des temps de réponse par type')
-        plt.legend()
-        plt.grid(True, alpha=0.3)
-        
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        else:
-            plt.show()
-        plt.close()
+        self._finish_plot(ax, save_path, own_figure)
     
     def plot_comparison(self, 
                        results: Dict[str, Dict],
                        metric: str,
-                       save_path: Optional[str] = None):
+                       save_path: Optional[str] = None,
+                       ax=None):
         """
         Compare une métrique entre différentes configurations
         
@@ -389,23 +641,24 @@ class Visualizer:
             results: Dictionnaire {nom_config: {métriques}}
             metric: Métrique à comparer
             save_path: Chemin pour sauvegarder la figure
+            ax: Axes matplotlib à réutiliser (une nouvelle figure si None)
         """
         configs = list(results.keys())
         values = [results[config].get(metric, 0) for config in configs]
         
-        plt.figure(figsize=(10, 6))
-        plt.bar(configs, values, edgecolor='black', alpha=0.7)
-        plt.xlabel('Configuration')
-        plt.ylabel(metric)
-        plt.title(f'Comparaison: {metric}')
-        plt.xticks(rotation=45, ha='right')
-        plt.grid(True, alpha=0.3, axis='y')
-        
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        else:
-            plt.show()
-        plt.close()
+        own_figure = ax is None
+        if own_figure:
+            ax = self._new_axes(figsize=(10, 6))
+        ax.bar(configs, values, edgecolor='black', alpha=0.7)
+        ax.set_xlabel('Configuration')
+        ax.set_ylabel(metric)
+        ax.set_title(f'Comparaison: {metric}')
+        for label in ax.get_xticklabels():
+            label.set_rotation(45)
+            label.set_horizontalalignment('right')
+        ax.grid(True, alpha=0.3, axis='y')
+        
+        self._finish_plot(ax, save_path, own_figure)
     
     def generate_full_report(self, output_dir: str, num_servers: int):
         """
@@ -415,31 +668,43 @@ class Visualizer:
             output_dir: Répertoire de sortie
             num_servers: Nombre de serveurs
         """
-        import os
-        os.makedirs(output_dir, exist_ok=True)
+        from pathlib import Path
+        from matplotlib.figure import Figure
+        
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+        
+        # Une seule figure (hors pyplot, donc sans backend interactif)
+        # réutilisée pour tous les graphiques
+        ax = Figure(figsize=(12, 6)).add_subplot()
         
         # Génération de tous les graphiques
-        self.plot_arrivals_over_time(f"{output_dir}/arrivals.png")
-        self.plot_queue_length_over_time(f"{output_dir}/queue_length.png")
-        self.plot_waiting_time_distribution(f"{output_dir}/waiting_time.png")
-        self.plot_response_time_by_type(f"{output_dir}/response_time_by_type.png")
+        self.plot_arrivals_over_time(output_path / "arrivals.png", ax=ax)
+        self.plot_queue_length_over_time(output_path / "queue_length.png", ax=ax)
+        self.plot_waiting_time_distribution(output_path / "waiting_time.png", ax=ax)
+        self.plot_response_time_by_type(output_path / "response_time_by_type.png", ax=ax)
         
         # Résumé textuel
         analyzer = PerformanceAnalyzer(self.df)
         summary = analyzer.get_summary(num_servers)
         
-        with open(f"{output_dir}/summary.txt", 'w') as f:
-            f.write("=== RAPPORT D'ANALYSE ===\n\n")
-            f.write(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            f.write(f"Débit: {summary['throughput']:.4f} jobs/unité\n")
-            f.write(f"Utilisation: {summary['utilization']:.2%}\n")
-            f.write(f"Taux de rejet: {summary['rejection_rate']:.2%}\n\n")
-            f.write("Temps d'attente:\n")
-            for key, val in summary['waiting_time'].items():
-                f.write(f"  {key}: {val:.4f}\n")
-            f.write("\nTemps de réponse:\n")
-            for key, val in summary['response_time'].items():
-                f.write(f"  {key}: {val:.4f}\n")
+        # Contenu assemblé en mémoire puis écrit en une fois
+        lines = [
+            "=== RAPPORT D'ANALYSE ===",
+            "",
+            f"Date: {datetime.now():%Y-%m-%d %H:%M:%S}",
+            "",
+            f"Débit: {summary['throughput']:.4f} jobs/unité",
+            f"Utilisation: {summary['utilization']:.2%}",
+            f"Taux de rejet: {summary['rejection_rate']:.2%}",
+            "",
+            "Temps d'attente:",
+            *(f"  {key}: {val:.4f}" for key, val in summary['waiting_time'].items()),
+            "",
+            "Temps de réponse:",
+            *(f"  {key}: {val:.4f}" for key, val in summary['response_time'].items()),
+        ]
+        (output_path / "summary.txt").write_text("\n".join(lines) + "\n")
 
 
 class RealDataComparator:
@@ -456,32 +721,72 @@ class RealDataComparator:
             tags_file: Chemin vers le fichier tags
             
         Returns:
-            DataFrame avec les données réelles
+            DataFrame avec les dates d'arrivée triées (receivedAt); les
+            temps inter-arrivées sont calculés à la demande
+            (interarrival_times)
         """
-        df = pd.read_csv(tags_file)
-        df['receivedAt'] = pd.to_datetime(df['receivedAt'])
-        df = df.sort_values('receivedAt')
-        df['interarrival_time'] = df['receivedAt'].diff().dt.total_seconds()
-        return df
+        # Seule la colonne des dates est lue, puis convertie en une passe
+        # (format ISO 8601 explicite, sans inférence ligne à ligne)
+        raw = pd.read_csv(tags_file, usecols=['receivedAt'])['receivedAt']
+        received_at = pd.to_datetime(raw, format='ISO8601')
+        
+        # Tri et différences sur les instants UTC en datetime64 (NumPy)
+        ticks = received_at.to_numpy(dtype='datetime64[ns]')
+        ticks.sort()
+        
+        sorted_received_at = pd.DatetimeIndex(ticks)
+        if received_at.dt.tz is not None:
+            sorted_received_at = sorted_received_at.tz_localize('UTC').tz_convert(received_at.dt.tz)
+        
+        return pd.DataFrame({'receivedAt': sorted_received_at})
+    
+    @staticmethod
+    def _received_ticks(real_data) -> np.ndarray:
+        """Instants d'arrivée triés en datetime64 (DataFrame ou tableau)"""
+        if isinstance(real_data, pd.DataFrame):
+            real_data = real_data['receivedAt']
+        return np.asarray(real_data, dtype='datetime64[ns]')
     
     @staticmethod
-    def estimate_arrival_rate(real_df: pd.DataFrame) -> float:
+    def interarrival_times(real_data) -> np.ndarray:
+        """
+        Calcule les temps inter-arrivées en secondes
+        
+        Args:
+            real_data: DataFrame retourné par load_real_data, ou tableau
+                       trié des instants d'arrivée
+            
+        Returns:
+            Temps inter-arrivées (n - 1 valeurs)
+        """
+        ticks = RealDataComparator._received_ticks(real_data)
+        return np.diff(ticks) / np.timedelta64(1, 's')
+    
+    @staticmethod
+    def estimate_arrival_rate(real_data) -> float:
         """
         Estime le taux d'arrivée λ à partir des données réelles
         
+        La moyenne des inter-arrivées se télescope en
+        (dernier - premier) / (n - 1): seules les deux extrémités des
+        instants triés sont lues.
+        
         Args:
-            real_df: DataFrame avec les données réelles
+            real_data: DataFrame retourné par load_real_data, ou tableau
+                       trié des instants d'arrivée
             
         Returns:
             Taux d'arrivée estimé (arrivées par seconde)
         """
-        interarrivals = real_df['interarrival_time'].dropna()
-        mean_interarrival = interarrivals.mean()
+        ticks = RealDataComparator._received_ticks(real_data)
+        if len(ticks) < 2:
+            return 0.0
         
-        if mean_interarrival == 0:
+        span = (ticks[-1] - ticks[0]) / np.timedelta64(1, 's')
+        if span <= 0:
             return 0.0
         
-        return 1.0 / mean_interarrival
+        return (len(ticks) - 1) / span
     
     @staticmethod
     def compare_distributions(real_df: pd.DataFrame,
@@ -498,11 +803,19 @@ class RealDataComparator:
         Returns:
             Statistiques de comparaison
         """
+        # Les inter-arrivées réelles ne sont plus stockées par load_real_data
+        if metric == 'interarrival_time' and metric not in real_df.columns:
+            real_df = pd.DataFrame({
+                metric: RealDataComparator.interarrival_times(real_df)
+            })
+        
         # Test de Kolmogorov-Smirnov
         if metric in real_df.columns and metric in simulated_df.columns:
             real_data = real_df[metric].dropna()
             sim_data = simulated_df[metric].dropna()
             
+            from scipy import stats
+            
             ks_stat, p_value = stats.ks_2samp(real_data, sim_data)
             
             return {
@@ -8,9 +8,30 @@ Ce module implémente:
 - Analyse des taux de rejet (Page Blanche vs Erreur immédiate)
 """
 
+import multiprocessing
 import simpy
-from typing import Optional
-from src.core.simulation_engine import SimulationLogger, EventType, Job
+import numpy as np
+from dataclasses import dataclass
+from typing import Optional, List, Dict, Any
+from src.core.simulation_engine import (
+    SimulationEngine, SimulationLogger, EventType, Job, ServiceEndExtra
+)
+from src.core.rng import poisson_arrival_times
+from src.core.fast_resource import FastResource
+
+
+@dataclass(slots=True)
+class QueueFullExtra:
+    """Données d'un rejet pour file pleine (pas de dict par événement)"""
+    rejection_reason: str
+    total_in_system: int
+
+
+@dataclass(slots=True)
+class ServersFullExtra:
+    """Données d'un rejet pour serveurs pleins (pas de dict par événement)"""
+    rejection_reason: str
+    servers_busy: int
 
 
 class LimitedQueue:
@@ -18,6 +39,12 @@ class LimitedQueue:
     File d'attente avec capacité limitée
     """
     
+    __slots__ = (
+        'env', 'queue_id', 'max_queue_size', 'num_servers', 'logger', 'resource',
+        '_q', '_in_system', '_total_cap', 'total_arrivals', 'total_rejections',
+        'rejections_queue_full', 'rejections_server_full', 'jobs_completed'
+    )
+    
     def __init__(self, 
                  env: simpy.Environment,
                  queue_id: str,
@@ -38,9 +65,17 @@ class LimitedQueue:
         self.num_servers = num_servers
         self.logger = logger
         
-        # Resource SimPy avec capacité limitée
+        # Ressource à capacité limitée (compteur + file FIFO, voir FastResource)
         # Capacité totale = serveurs + file d'attente
-        self.resource = simpy.Resource(env, capacity=num_servers)
+        self.resource = FastResource(env, num_servers)
+        
+        # Référence directe sur la file d'attente et nombre de jobs admis
+        # (en service ou en attente), tenu à jour par process_job
+        self._q = self.resource.queue
+        self._in_system = 0
+        
+        # Capacité totale fixée à la construction (serveurs + file)
+        self._total_cap = num_servers + max_queue_size
         
         # Statistiques
         self.total_arrivals = 0
@@ -51,15 +86,15 @@ class LimitedQueue:
         
     def get_queue_length(self) -> int:
         """Retourne la longueur actuelle de la file"""
-        return len(self.resource.queue)
+        return len(self._q)
     
     def get_total_in_system(self) -> int:
         """Retourne le nombre total d'entités dans le système"""
-        return self.resource.count + len(self.resource.queue)
+        return self._in_system
     
     def is_queue_full(self) -> bool:
         """Vérifie si la file d'attente est pleine"""
-        return len(self.resource.queue) >= self.max_queue_size
+        return len(self._q) >= self.max_queue_size
     
     def is_server_full(self) -> bool:
         """Vérifie si tous les serveurs sont occupés"""
@@ -76,10 +111,10 @@ class LimitedQueue:
         self.total_arrivals += 1
         
         # Vérification de la capacité AVANT d'entrer dans la file
-        total_in_system = self.get_total_in_system()
+        total_in_system = self._in_system
         
         # Rejet si le système est plein (serveurs + file)
-        if total_in_system >= (self.num_servers + self.max_queue_size):
+        if total_in_system >= self._total_cap:
             # Rejet - File d'attente pleine
             job.was_rejected = True
             job.rejection_reason = "queue_full"
@@ -92,16 +127,15 @@ class LimitedQueue:
                 entity_id=job.id,
                 entity_type=job.job_type,
                 server_id=self.queue_id,
-                queue_length=self.get_queue_length(),
-                extra_data={
-                    'rejection_reason': 'queue_full',
-                    'total_in_system': total_in_system
-                }
+                queue_length=len(self._q),
+                extra_data=QueueFullExtra('queue_full', total_in_system)
             )
             return
         
         # Tentative d'accès au serveur
-        with self.resource.request() as request:
+        self._in_system += 1
+        request = self.resource.request()
+        try:
             yield request
             
             # Début du service
@@ -110,20 +144,23 @@ class LimitedQueue:
             service_time = service_time_generator()
             job.service_time = service_time
             
-            self.logger.log_event(
-                time=self.env.now,
-                event_type=EventType.START_SERVICE,
-                entity_id=job.id,
-                entity_type=job.job_type,
-                server_id=self.queue_id,
-                queue_length=self.get_queue_length()
-            )
+            if self.logger.verbose_events:
+                self.logger.log_event(
+                    time=self.env.now,
+                    event_type=EventType.START_SERVICE,
+                    entity_id=job.id,
+                    entity_type=job.job_type,
+                    server_id=self.queue_id,
+                    queue_length=len(self._q)
+                )
             
             # Exécution du service
             yield self.env.timeout(service_time)
             
-            # Fin du service
+            # Fin du service: métriques calculées une fois et stockées
             job.end_time = self.env.now
+            job.waiting_time = job.start_time - job.arrival_time
+            job.response_time = job.end_time - job.arrival_time
             self.jobs_completed += 1
             
             self.logger.log_event(
@@ -132,13 +169,40 @@ class LimitedQueue:
                 entity_id=job.id,
                 entity_type=job.job_type,
                 server_id=self.queue_id,
-                queue_length=self.get_queue_length(),
-                extra_data={
-                    'service_time': service_time,
-                    'waiting_time': job.get_waiting_time(),
-                    'response_time': job.get_response_time()
-                }
+                queue_length=len(self._q),
+                extra_data=ServiceEndExtra(job.start_time, service_time,
+                                           job.waiting_time, job.response_time)
             )
+        finally:
+            # Job sorti du système, même interrompu: place rendue, ou
+            # requête retirée de la file s'il attendait encore
+            self._in_system -= 1
+            self.resource.cancel(request)
+    
+    @staticmethod
+    def analytic_rejection(offered_load: float, num_servers: int, max_queue_size: int) -> float:
+        """
+        Taux de rejet théorique d'une file M/M/c/K (K = c + kf places)
+        
+        Probabilité que le système soit plein, par les équations de
+        balance: p_n ∝ a^n / n! pour n ≤ c, puis un facteur a/c par place
+        d'attente. Les termes sont calculés par récurrence (pas de
+        factorielle explicite).
+        
+        Args:
+            offered_load: Charge offerte a = λ/μ
+            num_servers: Nombre de serveurs (ks)
+            max_queue_size: Taille de la file d'attente (kf)
+            
+        Returns:
+            Probabilité de rejet p_K
+        """
+        term = 1.0
+        total = 1.0
+        for n in range(1, num_servers + max_queue_size + 1):
+            term *= offered_load / min(n, num_servers)
+            total += term
+        return term / total
     
     def get_rejection_rate(self) -> float:
         """Calcule le taux de rejet"""
@@ -165,6 +229,9 @@ class LossSystem:
     Rejet si tous les serveurs sont occupés
     """
     
+    __slots__ = ('env', 'system_id', 'num_servers', 'logger', 'resource',
+                 'total_arrivals', 'total_rejections', 'jobs_completed')
+    
     def __init__(self,
                  env: simpy.Environment,
                  system_id: str,
@@ -183,7 +250,7 @@ class LossSystem:
         self.logger = logger
         
         # Resource sans file d'attente (capacité = nombre de serveurs)
-        self.resource = simpy.Resource(env, capacity=num_servers)
+        self.resource = FastResource(env, num_servers)
         
         # Statistiques
         self.total_arrivals = 0
@@ -214,30 +281,28 @@ class LossSystem:
                 entity_type=job.job_type,
                 server_id=self.system_id,
                 queue_length=0,
-                extra_data={
-                    'rejection_reason': 'servers_full',
-                    'servers_busy': self.resource.count
-                }
+                extra_data=ServersFullExtra('servers_full', self.resource.count)
             )
             return
         
         # Traitement normal
-        with self.resource.request() as request:
-            yield request
+        yield self.resource.request()
+        try:
             
             job.start_time = self.env.now
             job.server_id = self.system_id
             service_time = service_time_generator()
             job.service_time = service_time
             
-            self.logger.log_event(
-                time=self.env.now,
-                event_type=EventType.START_SERVICE,
-                entity_id=job.id,
-                entity_type=job.job_type,
-                server_id=self.system_id,
-                queue_length=0
-            )
+            if self.logger.verbose_events:
+                self.logger.log_event(
+                    time=self.env.now,
+                    event_type=EventType.START_SERVICE,
+                    entity_id=job.id,
+                    entity_type=job.job_type,
+                    server_id=self.system_id,
+                    queue_length=0
+                )
             
             yield self.env.timeout(service_time)
             
@@ -251,11 +316,30 @@ class LossSystem:
                 entity_type=job.job_type,
                 server_id=self.system_id,
                 queue_length=0,
-                extra_data={
-                    'service_time': service_time,
-                    'response_time': service_time  # Pas d'attente dans un Loss System
-                }
+                # Pas d'attente dans un Loss System
+                extra_data=ServiceEndExtra(job.start_time, service_time, 0.0, service_time)
             )
+        finally:
+            self.resource.release()
+    
+    @staticmethod
+    def analytic_blocking(offered_load: float, num_servers: int) -> float:
+        """
+        Probabilité de blocage théorique (formule d'Erlang B)
+        
+        Récurrence stable B(0) = 1, B(k) = a·B(k-1) / (k + a·B(k-1)).
+        
+        Args:
+            offered_load: Charge offerte a = λ/μ
+            num_servers: Nombre de serveurs (ks)
+            
+        Returns:
+            Probabilité de blocage B(c, a)
+        """
+        blocking = 1.0
+        for k in range(1, num_servers + 1):
+            blocking = offered_load * blocking / (k + offered_load * blocking)
+        return blocking
     
     def get_blocking_probability(self) -> float:
         """
@@ -316,57 +400,82 @@ class WaterfallScenario:
     def run_comparison(self, 
                       arrival_rate: float,
                       service_rate: float,
-                      duration: float) -> dict:
+                      duration: float,
+                      seed: Optional[int] = None,
+                      mode: str = 'simulate') -> dict:
         """
         Compare les deux approches (avec/sans file)
         
+        Les deux systèmes reçoivent le même flux d'arrivées et les mêmes
+        temps de service (nombres aléatoires communs): leur écart ne vient
+        que de la gestion de la capacité.
+        
         Args:
             arrival_rate: Taux d'arrivée λ
             service_rate: Taux de service μ
             duration: Durée de la simulation
+            seed: Graine du générateur propre à la comparaison (tirée du
+                  module random global si None)
+            mode: 'simulate' (simulation SimPy), 'analytic' (formules
+                  d'Erlang B et M/M/c/K seules, sans simulation) ou 'both'
             
         Returns:
-            Dictionnaire avec les résultats comparatifs
+            Dictionnaire avec les résultats comparatifs (clé 'analytic'
+            pour les valeurs théoriques)
         """
+        if mode not in ('simulate', 'analytic', 'both'):
+            raise ValueError(f"Mode inconnu: {mode}")
+        
+        offered_load = arrival_rate / service_rate
+        analytic = {
+            'queue_rejection_rate': LimitedQueue.analytic_rejection(
+                offered_load, self.limited_queue.num_servers, self.limited_queue.max_queue_size
+            ),
+            'loss_blocking_probability': LossSystem.analytic_blocking(
+                offered_load, self.loss_system.num_servers
+            )
+        }
+        
+        if mode == 'analytic':
+            return {'analytic': analytic}
+        
         import random
         
-        def service_time_gen():
-            return random.expovariate(service_rate)
+        # Générateur dédié: le module random global n'est consulté qu'une
+        # fois (graine), ce qui reste reproductible via SimulationEngine
+        if seed is None:
+            seed = random.getrandbits(64)
+        rng = np.random.default_rng(seed)
         
-        # Générateurs pour les deux systèmes
-        from src.core.simulation_engine import Job
+        # Instants d'arrivée et temps de service tous tirés d'avance
+        arrival_times = poisson_arrival_times(arrival_rate, duration, rng, start=self.env.now)
+        service_times = rng.exponential(1.0 / service_rate, arrival_times.size)
         
-        def arrivals_limited_queue():
-            while self.env.now < duration:
-                interarrival = random.expovariate(arrival_rate)
-                yield self.env.timeout(interarrival)
+        def fixed(value):
+            return lambda: value
+        
+        # Un seul générateur d'arrivées: chaque arrivée est dupliquée vers
+        # les deux systèmes
+        def arrivals():
+            for arrival_time, service_time in zip(arrival_times.tolist(), service_times.tolist()):
+                yield self.env.timeout(arrival_time - self.env.now)
                 
-                if self.env.now >= duration:
-                    break
+                service_time_gen = fixed(service_time)
                 
                 job = Job(arrival_time=self.env.now, job_type="ING")
                 self.env.process(self.limited_queue.process_job(job, service_time_gen))
-        
-        def arrivals_loss_system():
-            while self.env.now < duration:
-                interarrival = random.expovariate(arrival_rate)
-                yield self.env.timeout(interarrival)
-                
-                if self.env.now >= duration:
-                    break
                 
                 job = Job(arrival_time=self.env.now, job_type="ING")
                 self.env.process(self.loss_system.process_job(job, service_time_gen))
         
-        # Lancement des processus
-        self.env.process(arrivals_limited_queue())
-        self.env.process(arrivals_loss_system())
+        # Lancement du processus
+        self.env.process(arrivals())
         
         # Exécution
         self.env.run(until=duration)
         
         # Résultats
-        return {
+        results = {
             'limited_queue': self.limited_queue.get_stats(),
             'loss_system': self.loss_system.get_stats(),
             'comparison': {
@@ -375,3 +484,64 @@ class WaterfallScenario:
                 'loss_blocking_probability': self.loss_system.get_blocking_probability()
             }
         }
+        
+        if mode == 'both':
+            results['analytic'] = analytic
+        
+        return results
+    
+    @staticmethod
+    def sweep(param_grid: List[Dict[str, Any]],
+              n_workers: Optional[int] = None,
+              seed: Optional[int] = None) -> List[dict]:
+        """
+        Balayage de paramètres: chaque point est une comparaison
+        indépendante, exécutée dans son propre environnement SimPy et
+        répartie sur plusieurs processus
+        
+        Args:
+            param_grid: Liste de points {'lambda', 'mu', 'c', 'K', 'T'}
+                        (graine optionnelle 'seed')
+            n_workers: Nombre de processus (tous les cœurs si None, pas de
+                       pool si 1)
+            seed: Graine dont sont dérivées les graines des points qui n'en
+                  ont pas (flux indépendants via SeedSequence.spawn)
+            
+        Returns:
+            Résultats de run_comparison, dans l'ordre de param_grid
+        """
+        children = np.random.SeedSequence(seed).spawn(len(param_grid))
+        points = [
+            (index, {'seed': int(child.generate_state(1)[0]), **params})
+            for index, (params, child) in enumerate(zip(param_grid, children))
+        ]
+        
+        if n_workers == 1:
+            return [_run_point(point)[1] for point in points]
+        
+        results = [None] * len(points)
+        with multiprocessing.Pool(n_workers) as pool:
+            for index, result in pool.imap_unordered(_run_point, points):
+                results[index] = result
+        
+        return results
+
+
+def _run_point(point):
+    """
+    Exécute un point de WaterfallScenario.sweep (fonction de module pour
+    être transmise aux processus du pool)
+    
+    Args:
+        point: Couple (index, paramètres)
+        
+    Returns:
+        Couple (index, résultats de run_comparison)
+    """
+    index, params = point
+    engine = SimulationEngine(random_seed=params['seed'])
+    scenario = WaterfallScenario(engine.env, engine.logger, params['c'], params['K'])
+    
+    return index, scenario.run_comparison(
+        params['lambda'], params['mu'], params['T'], seed=params['seed']
+    )
@@ -10,6 +10,8 @@ from .simulation_engine import (
     Server,
     JobGenerator
 )
+from .rng import exp_stream, make_exp_gen, poisson_arrival_times
+from .fast_resource import FastResource
 
 __all__ = [
     'SimulationEngine',
@@ -17,5 +19,9 @@ __all__ = [
     'EventType',
     'Job',
     'Server',
-    'JobGenerator'
+    'JobGenerator',
+    'exp_stream',
+    'make_exp_gen',
+    'poisson_arrival_times',
+    'FastResource'
 ]
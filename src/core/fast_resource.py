@@ -0,0 +1,89 @@
+"""
+Module Core - Ressource allégée pour les serveurs
+Étudiant 1: Architecture Core & Moteur
+
+Ce module fournit:
+- Une ressource à capacité fixe remplaçant simpy.Resource lorsque seule
+  la capacité est modélisée (pas de priorités ni de préemption)
+"""
+
+import simpy
+from collections import deque
+
+
+class FastResource:
+    """
+    Ressource à capacité fixe: un compteur de places occupées et une file
+    FIFO d'événements en attente.
+
+    Contrairement à simpy.Resource, aucune requête n'est allouée quand une
+    place est libre: request() retourne un événement déjà déclenché,
+    partagé par toutes les requêtes. Utilisation:
+
+        yield resource.request()
+        try:
+            ...
+        finally:
+            resource.release()
+
+    Un processus interrompu pendant l'attente doit abandonner sa requête
+    avec cancel(), sans quoi la place lui serait attribuée plus tard:
+
+        request = resource.request()
+        try:
+            yield request
+        except simpy.Interrupt:
+            resource.cancel(request)
+    """
+
+    __slots__ = ('env', 'capacity', 'count', 'queue', '_granted')
+
+    def __init__(self, env: simpy.Environment, capacity: int):
+        """
+        Args:
+            env: Environnement SimPy
+            capacity: Nombre de places (serveurs en parallèle)
+        """
+        self.env = env
+        self.capacity = capacity
+        self.count = 0
+        self.queue = deque()
+
+        # Une fois traité par l'environnement, un yield sur cet événement
+        # reprend immédiatement, sans repasser par l'échéancier
+        self._granted = env.event().succeed()
+
+    def request(self) -> simpy.Event:
+        """
+        Demande une place
+
+        Returns:
+            Événement déclenché quand la place est attribuée
+        """
+        if self.count < self.capacity:
+            self.count += 1
+            return self._granted
+
+        waiter = self.env.event()
+        self.queue.append(waiter)
+        return waiter
+
+    def release(self):
+        """Libère une place (transmise directement au premier en attente)"""
+        if self.queue:
+            self.queue.popleft().succeed()
+        else:
+            self.count -= 1
+
+    def cancel(self, request: simpy.Event):
+        """
+        Abandonne une requête: retirée de la file si la place n'est pas
+        encore attribuée, sinon la place est libérée
+
+        Args:
+            request: Événement retourné par request()
+        """
+        if request.triggered:
+            self.release()
+        else:
+            self.queue.remove(request)
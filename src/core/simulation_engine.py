@@ -8,12 +8,20 @@ Ce module fournit:
 - Système de logging centralisé pour l'analyse
 """
 
+import dataclasses
+import itertools
+import random
+import sys
 import simpy
+import numpy as np
 import pandas as pd
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+from array import array
+from typing import List, Dict, Any, Iterator, Optional, Union
 from enum import Enum
 
+from .rng import poisson_arrival_times, exp_stream
+from .fast_resource import FastResource
+
 
 class EventType(Enum):
     """Types d'événements dans la simulation"""
@@ -23,79 +31,245 @@ class EventType(Enum):
     REJECTION = "rejection"
     BACKUP_START = "backup_start"
     BACKUP_END = "backup_end"
+    FAILURE = "failure"
+    RECOVERY = "recovery"
+
+
+# Valeurs internées des types d'événements, indexées par l'enum et par la
+# chaîne elle-même: log_event stocke toujours le même objet str, sans
+# passer par l'accès .value de l'enum
+_EVT_STR: Dict[Any, str] = {}
+# Codes entiers des types d'événements (index dans EventType), mêmes clés
+_EVT_CODE: Dict[Any, int] = {}
+for _code, _event_type in enumerate(EventType):
+    _EVT_STR[_event_type] = _EVT_STR[_event_type.value] = sys.intern(_event_type.value)
+    _EVT_CODE[_event_type] = _EVT_CODE[_event_type.value] = _code
+del _code, _event_type
+
+# Identifiants des jobs (compteur C, remis à zéro par SimulationEngine.reset)
+_job_ids = itertools.count()
+
+_NAN = float('nan')
+
+_ARRIVAL = _EVT_CODE[EventType.ARRIVAL]
+_REJECTION = _EVT_CODE[EventType.REJECTION]
+_END_SERVICE = _EVT_CODE[EventType.END_SERVICE]
+
+
+@dataclasses.dataclass(slots=True)
+class ServiceEndExtra:
+    """Données d'un événement END_SERVICE (champs fixes, pas de dict par événement)"""
+    start_time: float
+    service_time: float
+    waiting_time: float
+    response_time: float
 
 
 class SimulationLogger:
     """
     Système de logging centralisé pour collecter tous les événements
     de la simulation et générer des DataFrames pour l'analyse.
+    
+    Les événements sont stockés par colonnes (un tampon typé par champ)
+    plutôt qu'un dictionnaire par événement: log_event ne fait que des
+    append, et le DataFrame est construit colonne par colonne à la fin.
     """
     
-    def __init__(self):
-        self.events: List[Dict[str, Any]] = []
+    __slots__ = (
+        'verbose_events', '_time', '_event_type', '_event_code', '_entity_id', '_entity_type',
+        '_server_id', '_queue_length', '_extra_rows', '_extra'
+    )
+    
+    def __init__(self, verbose_events: bool = False):
+        """
+        Args:
+            verbose_events: Journalise aussi un événement START_SERVICE par
+                job servi. Par défaut, un job servi ne produit qu'une ligne
+                END_SERVICE portant start_time, service_time, waiting_time
+                et response_time.
+        """
+        self.verbose_events = verbose_events
+        
+        self._time = array('d')
+        self._event_type: List[str] = []
+        # Codes parallèles à _event_type (int8), pour les comptages
+        self._event_code = array('b')
+        self._entity_id = array('q')
+        self._entity_type: List[str] = []
+        self._server_id: List[Optional[str]] = []
+        # -1 code une longueur de file absente (None)
+        self._queue_length = array('q')
+        # Données supplémentaires: seules les lignes qui en ont sont stockées
+        self._extra_rows = array('q')
+        self._extra: List[Any] = []
         
     def log_event(self, 
                   time: float,
-                  event_type: EventType,
+                  event_type: Union[EventType, str],
                   entity_id: int,
                   entity_type: str,
                   server_id: Optional[str] = None,
                   queue_length: Optional[int] = None,
-                  extra_data: Optional[Dict[str, Any]] = None):
+                  extra_data: Optional[Any] = None):
         """
         Enregistre un événement dans le log
         
         Args:
             time: Temps simulé de l'événement
-            event_type: Type d'événement
+            event_type: Type d'événement (EventType ou sa valeur)
             entity_id: ID de l'entité (push/job)
             entity_type: Type d'entité (ING/PREPA)
             server_id: ID du serveur concerné
             queue_length: Longueur de la file au moment de l'événement
-            extra_data: Données supplémentaires spécifiques
-        """
-        event = {
-            'time': time,
-            'event_type': event_type.value,
-            'entity_id': entity_id,
-            'entity_type': entity_type,
-            'server_id': server_id,
-            'queue_length': queue_length,
-            'timestamp': datetime.now()
-        }
-        
+            extra_data: Données supplémentaires spécifiques: dictionnaire,
+                ou instance de dataclass (convertie seulement à la
+                construction du DataFrame)
+        """
         if extra_data:
-            event.update(extra_data)
-            
-        self.events.append(event)
+            self._extra_rows.append(len(self._time))
+            self._extra.append(extra_data)
+        
+        self._time.append(time)
+        self._event_type.append(_EVT_STR[event_type])
+        self._event_code.append(_EVT_CODE[event_type])
+        self._entity_id.append(entity_id)
+        self._entity_type.append(entity_type)
+        self._server_id.append(server_id)
+        self._queue_length.append(-1 if queue_length is None else queue_length)
+    
+    def __len__(self) -> int:
+        """Nombre d'événements enregistrés"""
+        return len(self._time)
+    
+    def _extra_columns(self) -> Dict[str, pd.Series]:
+        """
+        Reconstruit les colonnes des données supplémentaires
+        
+        Returns:
+            Dictionnaire {clé: Series indexée par numéro d'événement}, NaN
+            sur les événements sans cette donnée
+        """
+        rows: Dict[str, List[int]] = {}
+        values: Dict[str, List[Any]] = {}
+        
+        for row, extra in zip(self._extra_rows, self._extra):
+            if not isinstance(extra, dict):
+                extra = {field.name: getattr(extra, field.name)
+                         for field in dataclasses.fields(extra)}
+            for key, value in extra.items():
+                if key not in rows:
+                    rows[key] = []
+                    values[key] = []
+                rows[key].append(row)
+                values[key].append(value)
+        
+        index = pd.RangeIndex(len(self._time))
+        return {
+            key: pd.Series(values[key], index=rows[key]).reindex(index)
+            for key in rows
+        }
     
     def get_dataframe(self) -> pd.DataFrame:
         """
         Retourne tous les événements sous forme de DataFrame
+        
+        Les colonnes numériques sont copiées depuis les tampons (le logger
+        reste utilisable ensuite); event_type et entity_type sont
+        catégorielles.
         """
-        return pd.DataFrame(self.events)
+        if not self._time:
+            return pd.DataFrame()
+        
+        queue_length = np.frombuffer(self._queue_length, dtype=np.int64).copy()
+        if (queue_length < 0).any():
+            queue_length = np.where(queue_length < 0, np.nan, queue_length)
+        
+        columns = {
+            'time': np.frombuffer(self._time, dtype=np.float64).copy(),
+            'event_type': pd.Categorical(self._event_type),
+            'entity_id': np.frombuffer(self._entity_id, dtype=np.int64).copy(),
+            'entity_type': pd.Categorical(self._entity_type),
+            'server_id': self._server_id,
+            'queue_length': queue_length
+        }
+        columns.update(self._extra_columns())
+        
+        return pd.DataFrame(columns)
+    
+    def get_arrays(self) -> Dict[str, Any]:
+        """
+        Retourne les événements sous forme de colonnes NumPy typées (SoA)
+        
+        Les chaînes sont remplacées par des codes entiers:
+        - event_code: index dans EventType (int8)
+        - entity_code: code du type d'entité (int8)
+        Les valeurs absentes valent NaN (float64) ou -1 (queue_length).
+        
+        Returns:
+            Dictionnaire {colonne: tableau} plus les tables de correspondance
+            'event_names' et 'entity_names' ({code: nom})
+        """
+        n = len(self._time)
+        
+        entity_codes: Dict[str, int] = {}
+        entity_code = np.fromiter(
+            (entity_codes.setdefault(name, len(entity_codes)) for name in self._entity_type),
+            dtype=np.int8, count=n
+        )
+        
+        extra = self._extra_columns()
+        
+        def metric(key):
+            if key not in extra:
+                return np.full(n, np.nan)
+            return extra[key].to_numpy(dtype=np.float64)
+        
+        return {
+            'time': np.frombuffer(self._time, dtype=np.float64).copy(),
+            'event_code': np.frombuffer(self._event_code, dtype=np.int8).copy(),
+            'entity_code': entity_code,
+            'waiting_time': metric('waiting_time'),
+            'response_time': metric('response_time'),
+            'service_time': metric('service_time'),
+            'queue_length': np.frombuffer(self._queue_length, dtype=np.int64).astype(np.int32),
+            'event_names': {code: event_type.value for code, event_type in enumerate(EventType)},
+            'entity_names': {code: name for name, code in entity_codes.items()}
+        }
     
     def get_summary(self) -> Dict[str, Any]:
         """
         Retourne un résumé statistique des événements
+        
+        Calculé directement sur les tampons, sans construire de DataFrame:
+        un seul np.bincount sur les codes int8 des types d'événements, et
+        la durée est le temps du dernier événement (les événements sont journalisés à env.now,
+        donc dans l'ordre chronologique).
         """
-        df = self.get_dataframe()
-        if df.empty:
+        n = len(self._time)
+        if n == 0:
             return {}
         
+        counts = np.bincount(
+            np.frombuffer(self._event_code, dtype=np.int8), minlength=len(EventType)
+        )
+        
         summary = {
-            'total_events': len(df),
-            'total_arrivals': len(df[df['event_type'] == EventType.ARRIVAL.value]),
-            'total_rejections': len(df[df['event_type'] == EventType.REJECTION.value]),
-            'total_completed': len(df[df['event_type'] == EventType.END_SERVICE.value]),
-            'simulation_duration': df['time'].max() if len(df) > 0 else 0
+            'total_events': n,
+            'total_arrivals': int(counts[_ARRIVAL]),
+            'total_rejections': int(counts[_REJECTION]),
+            'total_completed': int(counts[_END_SERVICE]),
+            'simulation_duration': self._time[-1]
         }
         
         return summary
     
     def clear(self):
         """Efface tous les événements"""
-        self.events.clear()
+        for buffer in (self._time, self._event_code, self._entity_id,
+                       self._queue_length, self._extra_rows):
+            del buffer[:]
+        for column in (self._event_type, self._entity_type, self._server_id, self._extra):
+            column.clear()
 
 
 class Job:
@@ -103,7 +277,12 @@ class Job:
     Représente une soumission (git push) dans le système
     """
     
-    _id_counter = 0
+    # Attributs fixes: pas de __dict__ par job
+    __slots__ = (
+        'id', 'arrival_time', 'job_type', 'assignment', 'service_time',
+        'start_time', 'end_time', 'waiting_time', 'response_time',
+        'was_rejected', 'rejection_reason', 'server_id'
+    )
     
     def __init__(self, 
                  arrival_time: float,
@@ -115,33 +294,33 @@ class Job:
             job_type: Type de job (ING ou PREPA)
             assignment: Nom de l'assignment
         """
-        self.id = Job._id_counter
-        Job._id_counter += 1
+        self.id = next(_job_ids)
         
         self.arrival_time = arrival_time
         self.job_type = job_type
         self.assignment = assignment
         
-        # Temps de traitement (sera défini par le serveur)
-        self.service_time: Optional[float] = None
-        self.start_time: Optional[float] = None
-        self.end_time: Optional[float] = None
+        # Temps de traitement (sera défini par le serveur). NaN tant que
+        # non défini: les métriques dérivées valent alors NaN elles aussi
+        self.service_time: float = _NAN
+        self.start_time: float = _NAN
+        self.end_time: float = _NAN
+        
+        # Métriques figées par le serveur à la fin du service
+        self.waiting_time: float = _NAN
+        self.response_time: float = _NAN
         
         # Métadonnées
         self.was_rejected = False
         self.rejection_reason: Optional[str] = None
         self.server_id: Optional[str] = None
     
-    def get_waiting_time(self) -> Optional[float]:
-        """Retourne le temps d'attente"""
-        if self.start_time is None:
-            return None
+    def get_waiting_time(self) -> float:
+        """Retourne le temps d'attente (NaN si le service n'a pas commencé)"""
         return self.start_time - self.arrival_time
     
-    def get_response_time(self) -> Optional[float]:
-        """Retourne le temps de réponse total (attente + service)"""
-        if self.end_time is None:
-            return None
+    def get_response_time(self) -> float:
+        """Retourne le temps de réponse total (NaN si le service n'est pas terminé)"""
         return self.end_time - self.arrival_time
     
     def __repr__(self):
@@ -153,6 +332,9 @@ class Server:
     Représente un serveur de traitement (avec capacité limitée)
     """
     
+    __slots__ = ('env', 'server_id', 'resource', 'logger', '_q',
+                 'jobs_processed', '_service_times')
+    
     def __init__(self,
                  env: simpy.Environment,
                  server_id: str,
@@ -167,12 +349,16 @@ class Server:
         """
         self.env = env
         self.server_id = server_id
-        self.resource = simpy.Resource(env, capacity=num_servers)
+        self.resource = FastResource(env, num_servers)
         self.logger = logger
         
+        # Référence directe sur la file d'attente (lue à chaque événement journalisé)
+        self._q = self.resource.queue
+        
         # Statistiques
         self.jobs_processed = 0
-        self.total_service_time = 0.0
+        # Temps de service accumulés dans un tampon, sommés à la demande
+        self._service_times = array('d')
     
     def process(self, job: Job, service_time_generator):
         """
@@ -183,7 +369,8 @@ class Server:
             service_time_generator: Fonction qui génère le temps de service
         """
         # Demande d'accès au serveur
-        with self.resource.request() as request:
+        request = self.resource.request()
+        try:
             yield request
             
             # Début du service
@@ -192,22 +379,25 @@ class Server:
             service_time = service_time_generator()
             job.service_time = service_time
             
-            self.logger.log_event(
-                time=self.env.now,
-                event_type=EventType.START_SERVICE,
-                entity_id=job.id,
-                entity_type=job.job_type,
-                server_id=self.server_id,
-                queue_length=len(self.resource.queue)
-            )
+            if self.logger.verbose_events:
+                self.logger.log_event(
+                    time=self.env.now,
+                    event_type=EventType.START_SERVICE,
+                    entity_id=job.id,
+                    entity_type=job.job_type,
+                    server_id=self.server_id,
+                    queue_length=len(self._q)
+                )
             
             # Attente du temps de service
             yield self.env.timeout(service_time)
             
-            # Fin du service
+            # Fin du service: métriques calculées une fois et stockées
             job.end_time = self.env.now
+            job.waiting_time = job.start_time - job.arrival_time
+            job.response_time = job.end_time - job.arrival_time
             self.jobs_processed += 1
-            self.total_service_time += service_time
+            self._service_times.append(service_time)
             
             self.logger.log_event(
                 time=self.env.now,
@@ -215,13 +405,19 @@ class Server:
                 entity_id=job.id,
                 entity_type=job.job_type,
                 server_id=self.server_id,
-                queue_length=len(self.resource.queue),
-                extra_data={
-                    'service_time': service_time,
-                    'waiting_time': job.get_waiting_time(),
-                    'response_time': job.get_response_time()
-                }
+                queue_length=len(self._q),
+                extra_data=ServiceEndExtra(job.start_time, service_time,
+                                           job.waiting_time, job.response_time)
             )
+        finally:
+            # Place rendue, ou requête retirée de la file si le job a été
+            # interrompu pendant l'attente
+            self.resource.cancel(request)
+    
+    @property
+    def total_service_time(self) -> float:
+        """Temps de service cumulé (somme vectorisée du tampon)"""
+        return float(np.frombuffer(self._service_times, dtype=np.float64).sum())
     
     def get_utilization(self, simulation_time: float) -> float:
         """
@@ -241,20 +437,53 @@ class JobGenerator:
                  env: simpy.Environment,
                  logger: SimulationLogger,
                  arrival_rate: float,
-                 job_type: str = "ING"):
+                 job_type: str = "ING",
+                 rng: Optional[Union[random.Random, np.random.Generator]] = None):
         """
         Args:
             env: Environnement SimPy
             logger: Logger centralisé
             arrival_rate: Taux d'arrivée λ (jobs par unité de temps)
             job_type: Type de jobs générés (ING ou PREPA)
+            rng: Générateur aléatoire propre au scénario: random.Random, ou
+                 np.random.Generator pour des instants d'arrivée
+                 précalculés par blocs (module random global si None)
         """
         self.env = env
         self.logger = logger
         self.arrival_rate = arrival_rate
         self.job_type = job_type
+        self.rng = rng if rng is not None else random
         self.jobs_generated = 0
     
+    def _arrival_times(self, duration: float):
+        """
+        Instants d'arrivée des jobs jusqu'à `duration` (exclu)
+        
+        Avec un générateur NumPy, tous les instants sont calculés d'avance
+        (cumul vectorisé des inter-arrivées); sinon ils sont tirés un à un.
+        
+        Args:
+            duration: Durée de la simulation
+            
+        Returns:
+            Itérable d'instants d'arrivée croissants
+        """
+        if isinstance(self.rng, np.random.Generator):
+            return poisson_arrival_times(self.arrival_rate, duration, self.rng,
+                                         start=self.env.now).tolist()
+        return self._sequential_arrival_times(duration)
+    
+    def _sequential_arrival_times(self, duration: float):
+        """Instants d'arrivée tirés un à un avec rng.expovariate"""
+        time = self.env.now
+        expovariate = self.rng.expovariate
+        while True:
+            time += expovariate(self.arrival_rate)
+            if time >= duration:
+                return
+            yield time
+    
     def generate(self, server: Server, service_time_generator, duration: float):
         """
         Processus de génération de jobs
@@ -264,15 +493,8 @@ class JobGenerator:
             service_time_generator: Fonction qui génère les temps de service
             duration: Durée de la simulation
         """
-        import random
-        
-        while self.env.now < duration:
-            # Temps inter-arrivée exponentiel
-            interarrival_time = random.expovariate(self.arrival_rate)
-            yield self.env.timeout(interarrival_time)
-            
-            if self.env.now >= duration:
-                break
+        for arrival_time in self._arrival_times(duration):
+            yield self.env.timeout(arrival_time - self.env.now)
             
             # Création d'un nouveau job
             job = Job(
@@ -289,7 +511,7 @@ class JobGenerator:
                 entity_id=job.id,
                 entity_type=job.job_type,
                 server_id=server.server_id,
-                queue_length=len(server.resource.queue)
+                queue_length=len(server._q)
             )
             
             # Démarrage du traitement
@@ -301,19 +523,37 @@ class SimulationEngine:
     Moteur principal de simulation
     """
     
-    def __init__(self, random_seed: Optional[int] = None):
+    def __init__(self, random_seed: Optional[int] = None, verbose_events: bool = False):
         """
         Args:
             random_seed: Graine pour la reproductibilité
+            verbose_events: Journalise aussi les débuts de service
+                            (voir SimulationLogger)
         """
         self.env = simpy.Environment()
-        self.logger = SimulationLogger()
+        self.logger = SimulationLogger(verbose_events=verbose_events)
         self.random_seed = random_seed
         
+        # Générateur NumPy (PCG64) partagé par les générateurs du scénario
+        self.rng = np.random.default_rng(random_seed)
+        
         if random_seed is not None:
             import random
             random.seed(random_seed)
     
+    def exp_stream(self, rate: float, chunk: int = 8192) -> Iterator[float]:
+        """
+        Flux exponentiel tiré par blocs sur le générateur du moteur
+        
+        Args:
+            rate: Taux λ de la loi exponentielle
+            chunk: Nombre de tirages par bloc
+            
+        Returns:
+            Itérateur infini de temps exponentiels (voir rng.exp_stream)
+        """
+        return exp_stream(rate, self.rng, chunk)
+    
     def run(self, duration: float):
         """
         Lance la simulation
@@ -329,6 +569,13 @@ class SimulationEngine:
         """
         return self.logger.get_dataframe()
     
+    def get_results_soa(self) -> Dict[str, Any]:
+        """
+        Récupère les résultats sous forme de colonnes NumPy (voir
+        SimulationLogger.get_arrays), acceptées par PerformanceAnalyzer
+        """
+        return self.logger.get_arrays()
+    
     def get_summary(self) -> Dict[str, Any]:
         """
         Récupère un résumé des résultats
@@ -341,8 +588,10 @@ class SimulationEngine:
         """
         self.env = simpy.Environment()
         self.logger.clear()
-        Job._id_counter = 0
+        global _job_ids
+        _job_ids = itertools.count()
         
+        self.rng = np.random.default_rng(self.random_seed)
         if self.random_seed is not None:
             import random
             random.seed(self.random_seed)
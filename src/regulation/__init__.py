@@ -2,17 +2,37 @@
 Regulation Module - Regulation and heterogeneity
 """
 
-# Main imports for public API
-from .priority_queue import PriorityQueue
-from .gating import GatingController
-from .server import HeterogeneousServer
-from .population import PopulationGenerator
-from .scenario import ChannelsScenario
+import importlib
+
+# Public API, loaded lazily (PEP 562): each submodule is only imported
+# the first time one of its names is accessed
+_SUBMODULES = {
+    'PriorityQueue': '.priority_queue',
+    'Policy': '.priority_queue',
+    'GatingController': '.gating',
+    'HeterogeneousServer': '.server',
+    'PopulationGenerator': '.population',
+    'ChannelsScenario': '.scenario'
+}
 
 __all__ = [
     'PriorityQueue',
+    'Policy',
     'GatingController',
     'HeterogeneousServer',
     'PopulationGenerator',
     'ChannelsScenario'
 ]
+
+
+def __getattr__(name):
+    if name not in _SUBMODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_SUBMODULES[name], __name__), name)
+    globals()[name] = value  # Cached: later accesses skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
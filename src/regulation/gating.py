@@ -4,6 +4,8 @@ Prevents system access during specific periods
 """
 
 import simpy
+import numpy as np
+from bisect import bisect_left, bisect_right
 from typing import Optional, List
 
 
@@ -13,6 +15,8 @@ class GatingController:
     Prevents system access during specific periods
     """
     
+    __slots__ = ('env', 'gating_intervals', '_starts', '_ends')
+    
     def __init__(self,
                  env: simpy.Environment,
                  gating_intervals: List[tuple]):
@@ -20,9 +24,40 @@ class GatingController:
         Args:
             env: SimPy Environment
             gating_intervals: List of tuples (start_time, end_time) for closed periods
+        
+        Intervals are sorted and overlapping or adjacent ones are merged,
+        so that each closed period is a single [start, end) interval and
+        lookups can use binary search.
         """
         self.env = env
         self.gating_intervals = gating_intervals
+        
+        # Disjoint closed periods, sorted by start time
+        self._starts: List[float] = []
+        self._ends: List[float] = []
+        for start, end in sorted(gating_intervals):
+            if start >= end:
+                continue
+            if self._ends and start <= self._ends[-1]:
+                self._ends[-1] = max(self._ends[-1], end)
+            else:
+                self._starts.append(start)
+                self._ends.append(end)
+    
+    def _closing_end(self, time: float) -> Optional[float]:
+        """
+        Return the end of the closed period containing `time`
+        
+        Args:
+            time: Time to check
+            
+        Returns:
+            Reopening time, or None if the system is open at `time`
+        """
+        i = bisect_right(self._starts, time) - 1
+        if i >= 0 and time < self._ends[i]:
+            return self._ends[i]
+        return None
     
     def is_open(self, time: Optional[float] = None) -> bool:
         """
@@ -35,29 +70,65 @@ class GatingController:
             True if the system is open
         """
         check_time = time if time is not None else self.env.now
+        return self._closing_end(check_time) is None
+    
+    def next_open_time(self, time: float) -> float:
+        """
+        Return the first time at or after `time` when the system is open
         
-        for start, end in self.gating_intervals:
-            if start <= check_time < end:
-                return False  # Closed during this interval
+        Args:
+            time: Time to check
+            
+        Returns:
+            `time` itself if open, otherwise the end of its closed period
+        """
+        next_open = self._closing_end(time)
+        return time if next_open is None else next_open
+    
+    def next_open_times(self, times) -> np.ndarray:
+        """
+        Vectorized next_open_time for many times at once
         
-        return True
+        Args:
+            times: Times to check (array-like)
+            
+        Returns:
+            Array of the first open times at or after each time
+        """
+        times = np.asarray(times, dtype=np.float64)
+        if not self._starts:
+            return times.copy()
+        
+        ends = np.asarray(self._ends)
+        i = np.searchsorted(self._starts, times, side='right') - 1
+        period_end = ends[np.maximum(i, 0)]
+        closed = (i >= 0) & (times < period_end)
+        return np.where(closed, period_end, times)
+    
+    def final_closing_time(self, duration: float) -> float:
+        """
+        Return the time from which the system stays closed until `duration`
+        
+        Arrivals at or after this time can only be admitted at or after
+        `duration`.
+        
+        Args:
+            duration: End of the simulation
+            
+        Returns:
+            Start of the closed period reaching `duration`, or `duration`
+            itself if there is none
+        """
+        i = bisect_left(self._ends, duration)
+        if i < len(self._starts) and self._starts[i] < duration:
+            return self._starts[i]
+        return duration
     
     def wait_until_open(self):
         """
         Waiting process until system opens
         """
-        while not self.is_open():
-            # Find the next opening time
-            next_open = None
-            current_time = self.env.now
-            
-            for start, end in self.gating_intervals:
-                if start <= current_time < end:
-                    next_open = end
-                    break
-            
-            if next_open:
-                wait_time = next_open - current_time
-                yield self.env.timeout(wait_time)
-            else:
-                break
+        # Merged intervals: the end of the current period is the next opening
+        next_open = self._closing_end(self.env.now)
+        if next_open is not None:
+            yield self.env.timeout(next_open - self.env.now)
@@ -4,7 +4,11 @@ Generator for a specific population (ING or PREPA)
 
 import simpy
 import random
+import numpy as np
+from functools import partial
+from typing import Optional, Iterator
 from src.core.simulation_engine import SimulationLogger, Job
+from src.core.rng import make_exp_gen, poisson_arrival_times
 
 
 class PopulationGenerator:
@@ -17,7 +21,8 @@ class PopulationGenerator:
                  logger: SimulationLogger,
                  population_type: str,
                  arrival_rate: float,
-                 service_rate: float):
+                 service_rate: float,
+                 rng: Optional[np.random.Generator] = None):
         """
         Args:
             env: SimPy Environment
@@ -25,14 +30,68 @@ class PopulationGenerator:
             population_type: Population type ("ING" or "PREPA")
             arrival_rate: Arrival rate λ
             service_rate: Service rate μ
+            rng: NumPy generator: arrival and service times are then all
+                 drawn up front, in blocks (global random module if None)
         """
         self.env = env
         self.logger = logger
         self.population_type = population_type
         self.arrival_rate = arrival_rate
         self.service_rate = service_rate
+        self.rng = rng
         self.jobs_generated = 0
     
+    def _draws(self, duration: float):
+        """
+        Arrival times of the jobs until `duration` (excluded), and their
+        service times
+        
+        Args:
+            duration: Simulation duration
+        
+        Returns:
+            Tuple (iterable of arrival times, function returning the next
+            service time)
+        """
+        if self.rng is not None:
+            arrival_times = poisson_arrival_times(self.arrival_rate, duration, self.rng,
+                                                  start=self.env.now)
+            service_times = self.rng.exponential(1.0 / self.service_rate, arrival_times.size)
+            return arrival_times.tolist(), partial(next, iter(service_times.tolist()))
+        return self._sequential_arrival_times(duration), make_exp_gen(self.service_rate)
+    
+    def _sequential_arrival_times(self, duration: float):
+        """Arrival times drawn one at a time with random.expovariate"""
+        time = self.env.now
+        while True:
+            time += random.expovariate(self.arrival_rate)
+            if time >= duration:
+                return
+            yield time
+    
+    def iter_jobs(self, duration: float) -> Iterator[Job]:
+        """
+        Jobs of this population until `duration`, created lazily (without
+        SimPy), for HeterogeneousServer.run_native
+        
+        Args:
+            duration: Simulation duration
+            
+        Returns:
+            Iterator of jobs in arrival order, with their service times
+        """
+        arrival_times, service_time_gen = self._draws(duration)
+        
+        for arrival_time in arrival_times:
+            job = Job(
+                arrival_time=arrival_time,
+                job_type=self.population_type,
+                assignment=f"{self.population_type}_{self.jobs_generated}"
+            )
+            job.service_time = service_time_gen()
+            self.jobs_generated += 1
+            yield job
+    
     def generate(self, server, duration: float):
         """
         Generate jobs for this population
@@ -41,24 +100,27 @@ class PopulationGenerator:
             server: Server that will process the jobs (HeterogeneousServer)
             duration: Simulation duration
         """
-        def service_time_gen():
-            return random.expovariate(self.service_rate)
+        arrival_times, service_time_gen = self._draws(duration)
         
-        while self.env.now < duration:
-            # Inter-arrival time
-            interarrival = random.expovariate(self.arrival_rate)
-            yield self.env.timeout(interarrival)
-            
-            if self.env.now >= duration:
+        # Gate closed from `cutoff` until the end of the simulation: none
+        # of the remaining jobs could be served
+        gating = getattr(server, 'gating_controller', None)
+        cutoff = duration if gating is None else gating.final_closing_time(duration)
+        
+        for arrival_time in arrival_times:
+            if arrival_time >= cutoff:
                 break
             
+            yield self.env.timeout(arrival_time - self.env.now)
+            
             # Job creation
             job = Job(
                 arrival_time=self.env.now,
                 job_type=self.population_type,
                 assignment=f"{self.population_type}_{self.jobs_generated}"
             )
+            job.service_time = service_time_gen()
             self.jobs_generated += 1
             
-            # Processing
-            self.env.process(server.process_job(job, service_time_gen))
+            # Processing (no process per job)
+            server.submit(job)
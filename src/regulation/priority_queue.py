@@ -3,66 +3,135 @@ Priority queue with priority management
 Supports FIFO, SJF (Shortest Job First), and type-based priorities
 """
 
-from typing import Optional, List
+import heapq
+import itertools
+import math
+from collections import deque, defaultdict
+from enum import IntEnum
+from typing import Optional, List, Deque, Dict, Sequence, Union
 from src.core.simulation_engine import Job
 
 
+class Policy(IntEnum):
+    """Scheduling policies (integer tags, resolved once from their names)"""
+    FIFO = 0
+    SJF = 1
+    PRIORITY = 2
+
+
+def _sjf_key(job: Job) -> float:
+    """SJF sort key: jobs without a (positive) service time go last"""
+    service_time = job.service_time
+    return service_time if service_time > 0 else math.inf
+
+
 class PriorityQueue:
     """
     Priority queue with priority management
+    
+    The backing container depends on the policy the queue is built for:
+    with "SJF", jobs are kept in a binary min-heap on service time
+    (O(log n) add and extraction). With "PRIORITY", one deque per job
+    type (bucket queue): extraction only looks at the head of each bucket,
+    O(k) for k types whatever the queue length. Otherwise a single deque
+    is used: O(1) FIFO extraction, and it still supports every other
+    extraction order.
     """
     
-    def __init__(self):
-        self.queue: List[Job] = []
+    def __init__(self, policy: Optional[Union[Policy, str]] = None):
+        """
+        Args:
+            policy: Scheduling policy the queue is dedicated to (Policy or
+                    its name: "FIFO", "SJF", "PRIORITY"), or None for a
+                    generic queue
+        """
+        if isinstance(policy, str):
+            policy = Policy.__members__.get(policy)
+        self.policy = policy
+        self.queue: Deque[Job] = deque()
+        
+        # (key, counter, job): the counter keeps FIFO order on equal keys
+        self._heap: List[tuple] = []
+        self._counter = itertools.count()
+        
+        # Buckets by job type, of (counter, job)
+        self.buckets: Dict[str, Deque[tuple]] = defaultdict(deque)
+        self._bucket_len = 0
+        
+        # Insertion bound once for the container
+        if policy == Policy.SJF:
+            self.add = self._add_heap
+        elif policy == Policy.PRIORITY:
+            self.add = self._add_bucket
     
     def add(self, job: Job):
         """Add a job to the queue"""
         self.queue.append(job)
     
+    def _add_heap(self, job: Job):
+        """Add a job to the SJF heap"""
+        heapq.heappush(self._heap, (_sjf_key(job), next(self._counter), job))
+    
+    def _add_bucket(self, job: Job):
+        """Add a job to the bucket of its type"""
+        self.buckets[job.job_type].append((next(self._counter), job))
+        self._bucket_len += 1
+    
     def get_next_fifo(self) -> Optional[Job]:
         """Get the next job in FIFO order"""
-        if len(self.queue) == 0:
-            return None
-        return self.queue.pop(0)
+        return self.queue.popleft() if self.queue else None
     
     def get_next_sjf(self) -> Optional[Job]:
         """
         Get the next job according to Shortest Job First
         Assumes job.service_time is already defined
         """
+        if self._heap:
+            return heapq.heappop(self._heap)[2]
+        
         if len(self.queue) == 0:
             return None
         
-        # Find the job with minimum service time
-        min_idx = 0
-        min_time = self.queue[0].service_time if self.queue[0].service_time else float('inf')
-        
-        for i, job in enumerate(self.queue):
-            job_time = job.service_time if job.service_time else float('inf')
-            if job_time < min_time:
-                min_time = job_time
-                min_idx = i
-        
-        return self.queue.pop(min_idx)
+        # Generic queue: find the first job with minimum service time
+        job = min(self.queue, key=_sjf_key)
+        self.queue.remove(job)
+        return job
     
-    def get_next_priority(self, priority_order: List[str]) -> Optional[Job]:
+    def get_next_priority(self, priority_order: Sequence[str]) -> Optional[Job]:
         """
         Get the next job according to a priority order of types
         
         Args:
-            priority_order: List of types in priority order (e.g., ["ING", "PREPA"])
+            priority_order: Types in priority order (e.g., ["ING", "PREPA"])
         """
+        if self._bucket_len:
+            return self._pop_bucket(priority_order)
+        
         if len(self.queue) == 0:
             return None
         
         # Search first in priority order
         for job_type in priority_order:
-            for i, job in enumerate(self.queue):
+            for job in self.queue:
                 if job.job_type == job_type:
-                    return self.queue.pop(i)
+                    self.queue.remove(job)
+                    return job
         
         # If no job found in priorities, take the first one
-        return self.queue.pop(0)
+        return self.queue.popleft()
+    
+    def _pop_bucket(self, priority_order: Sequence[str]) -> Job:
+        """Pop from the first non-empty bucket in priority order"""
+        self._bucket_len -= 1
+        
+        for job_type in priority_order:
+            bucket = self.buckets.get(job_type)
+            if bucket:
+                return bucket.popleft()[1]
+        
+        # No prioritized type waiting: take the oldest job
+        bucket = min((b for b in self.buckets.values() if b), key=lambda b: b[0][0])
+        return bucket.popleft()[1]
     
     def __len__(self):
-        return len(self.queue)
+        return len(self.queue) + len(self._heap) + self._bucket_len
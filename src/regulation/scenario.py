@@ -2,7 +2,10 @@
 Complete scenario with multiple populations and regulation strategies
 """
 
+import heapq
 import simpy
+import numpy as np
+from operator import attrgetter
 from typing import Optional, List
 from src.core.simulation_engine import SimulationLogger
 from .gating import GatingController
@@ -21,7 +24,8 @@ class ChannelsScenario:
                  num_servers: int,
                  scheduling_policy: str = "FIFO",
                  use_gating: bool = False,
-                 gating_intervals: Optional[List[tuple]] = None):
+                 gating_intervals: Optional[List[tuple]] = None,
+                 rng: Optional[np.random.Generator] = None):
         """
         Args:
             env: SimPy Environment
@@ -30,9 +34,12 @@ class ChannelsScenario:
             scheduling_policy: Scheduling policy
             use_gating: Enable gating
             gating_intervals: Closure intervals
+            rng: NumPy generator shared by the populations (see
+                 PopulationGenerator)
         """
         self.env = env
         self.logger = logger
+        self.rng = rng
         
         # Gating controller
         gating_controller = None
@@ -68,20 +75,33 @@ class ChannelsScenario:
             logger=self.logger,
             population_type=population_type,
             arrival_rate=arrival_rate,
-            service_rate=service_rate
+            service_rate=service_rate,
+            rng=self.rng
         )
         self.populations[population_type] = gen
     
-    def run(self, duration: float) -> dict:
+    def run(self, duration: float, native: bool = False) -> dict:
         """
         Execute the scenario
         
         Args:
             duration: Simulation duration
+            native: Serve the populations' jobs, merged in arrival order,
+                    with the server's own event loop
+                    (HeterogeneousServer.run_native) rather than with SimPy
+                    processes
             
         Returns:
             Statistics by population
         """
+        if native:
+            jobs = heapq.merge(
+                *(generator.iter_jobs(duration) for generator in self.populations.values()),
+                key=attrgetter('arrival_time')
+            )
+            self.server.run_native(jobs, duration)
+            return self.server.get_stats()
+        
         # Launch generators
         for pop_type, generator in self.populations.items():
             self.env.process(generator.generate(self.server, duration))
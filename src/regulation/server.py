@@ -2,12 +2,37 @@
 Server managing multiple populations with different characteristics
 """
 
+import heapq
+import itertools
+import time
 import simpy
-from typing import Optional, Callable
+import numpy as np
+from dataclasses import dataclass
+from functools import partial
+from typing import Optional, Callable, Iterable, List, Dict, Tuple
 from src.core.simulation_engine import SimulationLogger, EventType, Job
-from .priority_queue import PriorityQueue
+from .priority_queue import PriorityQueue, Policy
 from .gating import GatingController
 
+@dataclass(slots=True)
+class StartServiceExtra:
+    """Extra data of a START_SERVICE event (no per-event dict)"""
+    scheduling_policy: str
+    service_time: float
+
+
+@dataclass(slots=True)
+class EndServiceExtra:
+    """Extra data of an END_SERVICE event (no per-event dict)"""
+    service_time: float
+    waiting_time: float
+    response_time: float
+
+
+# Event kinds of the native event loop (run_native)
+_DISPATCH = 1
+_END = 2
+
 
 class HeterogeneousServer:
     """
@@ -20,7 +45,10 @@ class HeterogeneousServer:
                  num_servers: int,
                  logger: SimulationLogger,
                  scheduling_policy: str = "FIFO",
-                 gating_controller: Optional[GatingController] = None):
+                 gating_controller: Optional[GatingController] = None,
+                 log_events: bool = True,
+                 priority_order: Tuple[str, ...] = ("ING", "PREPA"),
+                 profile: bool = False):
         """
         Args:
             env: SimPy Environment
@@ -29,134 +57,356 @@ class HeterogeneousServer:
             logger: Centralized logger
             scheduling_policy: Scheduling policy ("FIFO", "SJF", "PRIORITY")
             gating_controller: Optional gating controller
+            log_events: Record events in the logger. When False, only the
+                        per-type statistics (get_stats) are kept, which is
+                        enough for long policy comparisons.
+            priority_order: Job types from highest to lowest priority
+                            (PRIORITY policy)
+            profile: Accumulate the wall-clock time spent per phase
+                     (dispatch, stats, log), reported by get_stats under
+                     'perf_ns'. Off by default: no timing cost at all.
         """
         self.env = env
         self.server_id = server_id
         self.num_servers = num_servers
-        self.resource = simpy.Resource(env, capacity=num_servers)
         self.logger = logger
         self.scheduling_policy = scheduling_policy
+        # Integer tag (unknown names fall back to FIFO)
+        self.policy = Policy.__members__.get(scheduling_policy, Policy.FIFO)
         self.gating_controller = gating_controller
+        self._log_enabled = log_events
+        self._priority_order = tuple(priority_order)
         
-        # Custom queue
-        self.custom_queue = PriorityQueue()
+        # Custom queue (container specialized for the policy)
+        self.custom_queue = PriorityQueue(self.policy)
         
-        # Statistics by job type
-        self.stats_by_type = {}
+        # Extraction method bound once for the policy
+        self._dispatch = {
+            Policy.FIFO: self.custom_queue.get_next_fifo,
+            Policy.SJF: self.custom_queue.get_next_sjf,
+            Policy.PRIORITY: partial(self.custom_queue.get_next_priority, self._priority_order)
+        }[self.policy]
+        
+        # One long-lived worker process per server (SimPy path; see _worker)
+        self._wakeup = env.event()
+        for _ in range(num_servers):
+            env.process(self._worker())
+        
+        # Statistics by job type, one column per metric (struct of
+        # arrays) indexed by a type id assigned on first sight
+        self._type_ids: Dict[str, int] = {}
+        self.job_types: List[str] = []
+        self._arrivals: List[int] = []
+        self._completed: List[int] = []
+        self._rejected: List[int] = []
+        self._total_waiting_time: List[float] = []
+        self._total_service_time: List[float] = []
+        self._total_response_time: List[float] = []
+        
+        # Logging entry point, and optional per-phase profiling: the timed
+        # wrappers replace the bound methods, so the hot paths are the same
+        # code either way
+        self._log_event = logger.log_event
+        self._perf_ns: Optional[Dict[str, int]] = None
+        if profile:
+            self._perf_ns = {'dispatch': 0, 'stats': 0, 'log': 0}
+            self._dispatch = self._timed('dispatch', self._dispatch)
+            self._on_arrival = self._timed('stats', self._on_arrival)
+            self._on_completed = self._timed('stats', self._on_completed)
+            self._log_event = self._timed('log', self._log_event)
     
-    def _update_stats(self, job: Job, event: str):
-        """Update statistics for a job type"""
-        if job.job_type not in self.stats_by_type:
-            self.stats_by_type[job.job_type] = {
-                'arrivals': 0,
-                'completed': 0,
-                'rejected': 0,
-                'total_waiting_time': 0.0,
-                'total_service_time': 0.0,
-                'total_response_time': 0.0
-            }
+    def _timed(self, phase: str, func: Callable) -> Callable:
+        """
+        Wrap `func` so that its wall-clock time is added to a phase counter
         
-        stats = self.stats_by_type[job.job_type]
-        
-        if event == 'arrival':
-            stats['arrivals'] += 1
-        elif event == 'completed':
-            stats['completed'] += 1
-            if job.get_waiting_time():
-                stats['total_waiting_time'] += job.get_waiting_time()
-            if job.service_time:
-                stats['total_service_time'] += job.service_time
-            if job.get_response_time():
-                stats['total_response_time'] += job.get_response_time()
-        elif event == 'rejected':
-            stats['rejected'] += 1
+        Args:
+            phase: Key in the 'perf_ns' counters
+            func: Function to time
+        """
+        perf_ns = self._perf_ns
+        perf_counter_ns = time.perf_counter_ns
+        
+        def timed(*args, **kwargs):
+            start = perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                perf_ns[phase] += perf_counter_ns() - start
+        
+        return timed
+    
+    def _type_id(self, job_type: str) -> int:
+        """Return the id of a job type, adding its statistics columns if new"""
+        type_id = self._type_ids.get(job_type)
+        if type_id is None:
+            type_id = self._type_ids[job_type] = len(self.job_types)
+            self.job_types.append(job_type)
+            for column in (self._arrivals, self._completed, self._rejected):
+                column.append(0)
+            for column in (self._total_waiting_time, self._total_service_time,
+                           self._total_response_time):
+                column.append(0.0)
+        return type_id
     
-    def process_job(self, 
-                   job: Job,
-                   service_time_generator: Callable[[], float]):
+    def _on_arrival(self, job: Job):
+        """Count an arrival in the statistics of its type"""
+        self._arrivals[self._type_id(job.job_type)] += 1
+    
+    def _on_completed(self, job: Job):
+        """
+        Add a completed job to the statistics of its type
+        
+        job.waiting_time and job.response_time must already be set (see
+        _worker).
+        """
+        type_id = self._type_id(job.job_type)
+        self._completed[type_id] += 1
+        self._total_waiting_time[type_id] += job.waiting_time
+        self._total_service_time[type_id] += job.service_time
+        self._total_response_time[type_id] += job.response_time
+    
+    def _on_rejected(self, job: Job):
+        """Count a rejection in the statistics of its type"""
+        self._rejected[self._type_id(job.job_type)] += 1
+    
+    def submit(self, job: Job):
+        """
+        Hand a job to the server without creating a process for it
+        
+        Same behaviour as process_job: the job is admitted at once, or at
+        the reopening of the gate through a timeout whose callback admits
+        it.
+        
+        Args:
+            job: The job to process, with job.service_time already drawn
+                 (needed up front by SJF)
+        """
+        if self.gating_controller is not None:
+            next_open = self.gating_controller.next_open_time(self.env.now)
+            if next_open > self.env.now:
+                released = self.env.timeout(next_open - self.env.now, value=job)
+                released.callbacks.append(self._admit_released)
+                return
+        
+        self._admit(job)
+    
+    def process_job(self, job: Job):
         """
         Process a job with gating and priority management
         
         Args:
-            job: The job to process
-            service_time_generator: Function generating the service time
+            job: The job to process, with job.service_time already drawn
+                 (needed up front by SJF)
         """
-        # Gating verification
-        if self.gating_controller and not self.gating_controller.is_open():
-            # Attente de l'ouverture
-            yield self.env.process(self.gating_controller.wait_until_open())
+        # Gating verification: wait for the reopening with a single
+        # timeout (no sub-process)
+        if self.gating_controller is not None:
+            next_open = self.gating_controller.next_open_time(self.env.now)
+            if next_open > self.env.now:
+                yield self.env.timeout(next_open - self.env.now)
         
+        self._admit(job)
+    
+    def _admit_released(self, event: simpy.Event):
+        """Timeout callback: admit the job released by the gate"""
+        self._admit(event.value)
+    
+    def _admit(self, job: Job):
+        """Record the arrival of a job and add it to the queue"""
         # Enregistrement de l'arrivée
-        self._update_stats(job, 'arrival')
-        
-        self.logger.log_event(
-            time=self.env.now,
-            event_type=EventType.ARRIVAL,
-            entity_id=job.id,
-            entity_type=job.job_type,
-            server_id=self.server_id,
-            queue_length=len(self.custom_queue)
-        )
-        
-        # Generate service time for SJF
-        service_time = service_time_generator()
-        job.service_time = service_time
-        
-        # Add to custom queue
-        self.custom_queue.add(job)
-        
-        # Wait for server
-        with self.resource.request() as request:
-            yield request
-            
-            # Retrieve job according to policy
-            if self.scheduling_policy == "SJF":
-                current_job = self.custom_queue.get_next_sjf()
-            elif self.scheduling_policy == "PRIORITY":
-                current_job = self.custom_queue.get_next_priority(["ING", "PREPA"])
-            else:  # FIFO by default
-                current_job = self.custom_queue.get_next_fifo()
+        self._on_arrival(job)
+        
+        queue = self.custom_queue
+        if self._log_enabled:
+            self._log_event(
+                time=self.env.now,
+                event_type=EventType.ARRIVAL,
+                entity_id=job.id,
+                entity_type=job.job_type,
+                server_id=self.server_id,
+                queue_length=len(queue)
+            )
+        
+        # Add to custom queue; an idle worker picks the job to serve
+        queue.add(job)
+        if not self._wakeup.triggered:
+            self._wakeup.succeed()
+    
+    def _worker(self):
+        """
+        Long-lived server process: pop the next job according to policy,
+        serve it, and start over as long as the queue is not empty
+        
+        There is one worker per server, started with the server, so no
+        process is created per job. Idle workers wait on a shared wakeup,
+        a normal-priority event: jobs arriving at the same instant (e.g.
+        released together by a gate reopening) are all in the queue before
+        the choice is made.
+        """
+        env = self.env
+        queue = self.custom_queue
+        
+        while True:
+            while not len(queue):
+                if self._wakeup.processed:
+                    self._wakeup = env.event()
+                yield self._wakeup
             
-            if current_job is None:
-                return
+            job = self._dispatch()
             
             # Start of service
-            current_job.start_time = self.env.now
-            current_job.server_id = self.server_id
+            now = env.now
+            service_time = job.service_time
+            job.start_time = now
+            job.server_id = self.server_id
             
-            self.logger.log_event(
-                time=self.env.now,
-                event_type=EventType.START_SERVICE,
-                entity_id=current_job.id,
-                entity_type=current_job.job_type,
-                server_id=self.server_id,
-                queue_length=len(self.custom_queue),
-                extra_data={
-                    'scheduling_policy': self.scheduling_policy,
-                    'service_time': current_job.service_time
-                }
-            )
+            if self._log_enabled:
+                self._log_event(
+                    time=now,
+                    event_type=EventType.START_SERVICE,
+                    entity_id=job.id,
+                    entity_type=job.job_type,
+                    server_id=self.server_id,
+                    queue_length=len(queue),
+                    extra_data=StartServiceExtra(self.scheduling_policy, service_time)
+                )
             
             # Execute service
-            yield self.env.timeout(current_job.service_time)
+            yield env.timeout(service_time)
             
-            # End of service
-            current_job.end_time = self.env.now
-            self._update_stats(current_job, 'completed')
+            # End of service: metrics computed once, for stats and log
+            end_time = env.now
+            job.end_time = end_time
+            job.waiting_time = waiting_time = now - job.arrival_time
+            job.response_time = response_time = end_time - job.arrival_time
+            self._on_completed(job)
             
-            self.logger.log_event(
-                time=self.env.now,
-                event_type=EventType.END_SERVICE,
-                entity_id=current_job.id,
-                entity_type=current_job.job_type,
-                server_id=self.server_id,
-                queue_length=len(self.custom_queue),
-                extra_data={
-                    'service_time': current_job.service_time,
-                    'waiting_time': current_job.get_waiting_time(),
-                    'response_time': current_job.get_response_time()
-                }
-            )
+            if self._log_enabled:
+                self._log_event(
+                    time=end_time,
+                    event_type=EventType.END_SERVICE,
+                    entity_id=job.id,
+                    entity_type=job.job_type,
+                    server_id=self.server_id,
+                    queue_length=len(queue),
+                    extra_data=EndServiceExtra(service_time, waiting_time, response_time)
+                )
+    
+    def run_native(self, jobs: Iterable[Job], duration: float):
+        """
+        Serve pre-drawn jobs with a hand-rolled event loop instead of SimPy
+        
+        Same behaviour as submit and the workers: gating delays
+        arrivals to the reopening time, a job joins the policy queue on
+        arrival and is dispatched as soon as a server is free. Pending
+        dispatches and ends of service are kept in a heap of (time,
+        counter, kind, job), so nothing goes through SimPy's scheduler;
+        env.now is not advanced.
+        
+        A server freed by an arrival is reserved and its dispatch is an
+        event at the same time, processed after the other arrivals of that
+        instant (like the worker wakeup): jobs released together by a
+        gate reopening are all candidates for SJF and PRIORITY.
+        
+        Jobs are pulled from `jobs` one at a time, as their arrival comes,
+        and only the calendar and the queue refer to them afterwards: a
+        lazy iterable keeps memory proportional to the jobs in the system.
+        Only ids and times are passed to the logger.
+        
+        Args:
+            jobs: Jobs in arrival order, with arrival_time and service_time set
+            duration: Simulation duration (events at or after it are ignored)
+        """
+        counter = itertools.count()
+        gating = self.gating_controller
+        
+        def arrivals():
+            for job in jobs:
+                arrival = job.arrival_time
+                if gating is not None:
+                    arrival = gating.next_open_time(arrival)
+                if arrival >= duration:
+                    return
+                yield arrival, job
+        
+        arrivals = arrivals()
+        next_arrival = next(arrivals, None)
+        
+        events = []
+        queue = self.custom_queue
+        dispatch = self._dispatch
+        log_enabled = self._log_enabled
+        log_event = self._log_event
+        server_id = self.server_id
+        free_servers = self.num_servers
+        
+        def start(job, now):
+            job.start_time = now
+            job.server_id = server_id
+            if log_enabled:
+                log_event(now, EventType.START_SERVICE, job.id, job.job_type, server_id,
+                          len(queue), StartServiceExtra(self.scheduling_policy, job.service_time))
+            heapq.heappush(events, (now + job.service_time, next(counter), _END, job))
+        
+        while True:
+            # Arrivals first at equal times (they precede pending events)
+            if next_arrival is not None and (not events or next_arrival[0] <= events[0][0]):
+                now, job = next_arrival
+                next_arrival = next(arrivals, None)
+                
+                self._on_arrival(job)
+                if log_enabled:
+                    log_event(now, EventType.ARRIVAL, job.id, job.job_type, server_id, len(queue))
+                
+                queue.add(job)
+                if free_servers > 0:
+                    free_servers -= 1
+                    heapq.heappush(events, (now, next(counter), _DISPATCH, None))
+                continue
+            
+            if not events or events[0][0] >= duration:
+                break
+            
+            now, _, kind, job = heapq.heappop(events)
+            
+            if kind == _DISPATCH:
+                start(dispatch(), now)
+            else:
+                job.end_time = now
+                job.waiting_time = job.start_time - job.arrival_time
+                job.response_time = now - job.arrival_time
+                self._on_completed(job)
+                if log_enabled:
+                    log_event(now, EventType.END_SERVICE, job.id, job.job_type, server_id,
+                              len(queue), EndServiceExtra(job.service_time, job.waiting_time,
+                                                          job.response_time))
+                
+                # The freed server takes the next job according to policy
+                if len(queue):
+                    start(dispatch(), now)
+                else:
+                    free_servers += 1
+    
+    def get_averages(self) -> Dict[str, np.ndarray]:
+        """
+        Average times of every job type at once (0.0 for types without
+        completed jobs)
+        
+        Returns:
+            Dictionary {metric: array indexed by type id, see job_types}
+        """
+        completed = np.asarray(self._completed, dtype=np.float64)
+        done = completed > 0
+        
+        def average(totals):
+            return np.divide(np.asarray(totals, dtype=np.float64), completed,
+                             out=np.zeros_like(completed), where=done)
+        
+        return {
+            'avg_waiting_time': average(self._total_waiting_time),
+            'avg_service_time': average(self._total_service_time),
+            'avg_response_time': average(self._total_response_time)
+        }
     
     def get_stats(self) -> dict:
         """Return statistics by job type"""
@@ -166,15 +416,17 @@ class HeterogeneousServer:
             'by_type': {}
         }
         
-        for job_type, stats in self.stats_by_type.items():
-            completed = stats['completed']
+        averages = {metric: values.tolist() for metric, values in self.get_averages().items()}
+        
+        for type_id, job_type in enumerate(self.job_types):
             result['by_type'][job_type] = {
-                'arrivals': stats['arrivals'],
-                'completed': completed,
-                'rejected': stats['rejected'],
-                'avg_waiting_time': stats['total_waiting_time'] / completed if completed > 0 else 0.0,
-                'avg_service_time': stats['total_service_time'] / completed if completed > 0 else 0.0,
-                'avg_response_time': stats['total_response_time'] / completed if completed > 0 else 0.0
+                'arrivals': self._arrivals[type_id],
+                'completed': self._completed[type_id],
+                'rejected': self._rejected[type_id],
+                **{metric: values[type_id] for metric, values in averages.items()}
             }
         
+        if self._perf_ns is not None:
+            result['perf_ns'] = dict(self._perf_ns)
+        
         return result
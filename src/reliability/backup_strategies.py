@@ -8,15 +8,75 @@ Ce module implémente:
 - Analyse d'impact sur le débit et la congestion
 """
 
+import heapq
 import simpy
 import random
-from typing import Optional, Callable
+import numpy as np
+from dataclasses import dataclass
+from functools import partial
+from typing import Optional, Callable, Union
 from src.core.simulation_engine import SimulationLogger, EventType, Job
+from src.core.fast_resource import FastResource
+from src.core.rng import make_exp_gen, exp_stream, bernoulli_stream, poisson_arrival_times
+
+
+@dataclass(slots=True)
+class BackupStartExtra:
+    """Données d'un événement BACKUP_START (pas de dict par événement)"""
+    backup_time: float
+
+
+@dataclass(slots=True)
+class BackupServiceStartExtra:
+    """Données d'un événement START_SERVICE avec backup"""
+    backup_done: bool
+    backup_time: float
+
+
+@dataclass(slots=True)
+class BackupServiceEndExtra:
+    """Données d'un événement END_SERVICE avec backup"""
+    service_time: float
+    backup_time: float
+    total_processing_time: float
+    waiting_time: float
+    response_time: float
+
+
+@dataclass(slots=True)
+class FailureExtra:
+    """Données d'un événement FAILURE"""
+    failure_number: int
+
+
+@dataclass(slots=True)
+class RecoveryExtra:
+    """Données d'un événement RECOVERY"""
+    downtime: float
+    total_downtime: float
+
+
+def _exp_gen(rate: float, rng: Optional[np.random.Generator]) -> Callable[[], float]:
+    """
+    Générateur exponentiel sans argument: tirages NumPy par blocs si un
+    générateur est fourni, sinon sur le module random
+    
+    Args:
+        rate: Taux λ de la loi exponentielle
+        rng: Générateur NumPy, ou None
+    """
+    if rng is None:
+        return make_exp_gen(rate)
+    return partial(next, exp_stream(rate, rng))
 
 
 class BackupStrategy:
     """Stratégie de base pour les backups"""
     
+    # Tous les jobs sont sauvegardés: le serveur se passe alors de
+    # should_backup (aucun appel par job)
+    always_backup = False
+    
     def should_backup(self, job: Job) -> bool:
         """
         Détermine si un job doit être sauvegardé
@@ -28,6 +88,19 @@ class BackupStrategy:
             True si le job doit être sauvegardé
         """
         raise NotImplementedError
+    
+    def backup_mask(self, n: int, rng: np.random.Generator) -> np.ndarray:
+        """
+        Décisions de backup de n jobs successifs d'un coup (boucle native)
+        
+        Args:
+            n: Nombre de jobs
+            rng: Générateur NumPy
+            
+        Returns:
+            Tableau de booléens, True pour les jobs à sauvegarder
+        """
+        raise NotImplementedError
 
 
 class SystematicBackup(BackupStrategy):
@@ -36,9 +109,14 @@ class SystematicBackup(BackupStrategy):
     Risque de congestion synchronisée
     """
     
+    always_backup = True
+    
     def should_backup(self, job: Job) -> bool:
         return True
     
+    def backup_mask(self, n: int, rng: np.random.Generator) -> np.ndarray:
+        return np.ones(n, dtype=bool)
+    
     def __repr__(self):
         return "SystematicBackup"
 
@@ -49,15 +127,55 @@ class RandomBackup(BackupStrategy):
     Réduit le risque de congestion
     """
     
-    def __init__(self, backup_probability: float = 0.5):
+    def __init__(self,
+                 backup_probability: float = 0.5,
+                 rng: Optional[Union[np.random.Generator, random.Random]] = None):
         """
         Args:
             backup_probability: Probabilité de sauvegarder un job (0 à 1)
+            rng: Générateur NumPy (décisions tirées par blocs), instance
+                 random.Random dédiée (un tirage par job, sans l'état
+                 global), ou None pour le module random
         """
         self.backup_probability = backup_probability
+        
+        # Décision liée une fois pour toutes: constante aux bornes (aucun
+        # tirage), sinon selon la source des tirages
+        if backup_probability >= 1.0:
+            self.always_backup = True
+            self.should_backup = self._always
+        elif backup_probability <= 0.0:
+            self.should_backup = self._never
+        elif isinstance(rng, random.Random):
+            self._uniform = rng.random
+            self.should_backup = self._should_backup_own
+        elif rng is not None:
+            self._decisions = bernoulli_stream(backup_probability, rng)
+            self.should_backup = self._should_backup_drawn
     
-    def should_backup(self, job: Job) -> bool:
-        return random.random() < self.backup_probability
+    def should_backup(self, job: Job, _random=random.random) -> bool:
+        return _random() < self.backup_probability
+    
+    def _should_backup_own(self, job: Job) -> bool:
+        """Décision tirée sur l'instance random.Random de la stratégie"""
+        return self._uniform() < self.backup_probability
+    
+    def _should_backup_drawn(self, job: Job) -> bool:
+        """Décision suivante du flux tiré par blocs"""
+        return next(self._decisions)
+    
+    @staticmethod
+    def _always(job: Job) -> bool:
+        """Décision pour une probabilité de 1"""
+        return True
+    
+    @staticmethod
+    def _never(job: Job) -> bool:
+        """Décision pour une probabilité nulle"""
+        return False
+    
+    def backup_mask(self, n: int, rng: np.random.Generator) -> np.ndarray:
+        return rng.random(n) < self.backup_probability
     
     def __repr__(self):
         return f"RandomBackup(p={self.backup_probability})"
@@ -92,6 +210,11 @@ class ReliableServer:
     Serveur avec stratégie de backup
     """
     
+    __slots__ = ('env', 'server_id', 'resource', 'logger', 'backup_strategy',
+                 'backup_time_generator', '_q', '_should_backup', '_always_backup', '_strategy_repr',
+                 'jobs_processed', 'jobs_backed_up',
+                 'total_backup_time', 'total_service_time')
+    
     def __init__(self,
                  env: simpy.Environment,
                  server_id: str,
@@ -110,11 +233,20 @@ class ReliableServer:
         """
         self.env = env
         self.server_id = server_id
-        self.resource = simpy.Resource(env, capacity=num_servers)
+        self.resource = FastResource(env, num_servers)
         self.logger = logger
         self.backup_strategy = backup_strategy
         self.backup_time_generator = backup_time_generator
         
+        # Référence directe sur la file d'attente (lue à chaque événement journalisé)
+        self._q = self.resource.queue
+        # Décision de backup liée une fois (méthode de la stratégie), ou
+        # spécialisée si elle est constante
+        self._should_backup = backup_strategy.should_backup
+        self._always_backup = backup_strategy.always_backup
+        # Nom de la stratégie formaté une fois (repris par chaque get_stats)
+        self._strategy_repr = repr(backup_strategy)
+        
         # Statistiques
         self.jobs_processed = 0
         self.jobs_backed_up = 0
@@ -129,83 +261,145 @@ class ReliableServer:
             job: Le job à traiter
             service_time_generator: Fonction générant le temps de service
         """
-        with self.resource.request() as request:
+        env = self.env
+        log_event = self.logger.log_event
+        server_id = self.server_id
+        queue = self._q
+        
+        request = self.resource.request()
+        try:
             yield request
             
-            job.start_time = self.env.now
-            job.server_id = self.server_id
+            job.start_time = env.now
+            job.server_id = server_id
             
             # Décision de backup
-            needs_backup = self.backup_strategy.should_backup(job)
+            needs_backup = self._always_backup or self._should_backup(job)
             backup_time = 0.0
             
             if needs_backup:
                 # Phase de backup
                 backup_time = self.backup_time_generator()
                 
-                self.logger.log_event(
-                    time=self.env.now,
+                log_event(
+                    time=env.now,
                     event_type=EventType.BACKUP_START,
                     entity_id=job.id,
                     entity_type=job.job_type,
-                    server_id=self.server_id,
-                    queue_length=len(self.resource.queue),
-                    extra_data={'backup_time': backup_time}
+                    server_id=server_id,
+                    queue_length=len(queue),
+                    extra_data=BackupStartExtra(backup_time)
                 )
                 
-                yield self.env.timeout(backup_time)
+                yield env.timeout(backup_time)
                 
                 self.jobs_backed_up += 1
                 self.total_backup_time += backup_time
                 
-                self.logger.log_event(
-                    time=self.env.now,
+                # Pas de yield jusqu'au début du service: même longueur de
+                # file pour BACKUP_END et START_SERVICE
+                queue_length = len(queue)
+                log_event(
+                    time=env.now,
                     event_type=EventType.BACKUP_END,
                     entity_id=job.id,
                     entity_type=job.job_type,
-                    server_id=self.server_id,
-                    queue_length=len(self.resource.queue)
+                    server_id=server_id,
+                    queue_length=queue_length
                 )
+            else:
+                queue_length = len(queue)
             
             # Phase de service normale
             service_time = service_time_generator()
             job.service_time = service_time
             
-            self.logger.log_event(
-                time=self.env.now,
+            log_event(
+                time=env.now,
                 event_type=EventType.START_SERVICE,
                 entity_id=job.id,
                 entity_type=job.job_type,
-                server_id=self.server_id,
-                queue_length=len(self.resource.queue),
-                extra_data={
-                    'backup_done': needs_backup,
-                    'backup_time': backup_time
-                }
+                server_id=server_id,
+                queue_length=queue_length,
+                extra_data=BackupServiceStartExtra(needs_backup, backup_time)
             )
             
-            yield self.env.timeout(service_time)
+            yield env.timeout(service_time)
             
             # Fin du traitement
-            job.end_time = self.env.now
+            job.end_time = env.now
             self.jobs_processed += 1
             self.total_service_time += service_time
             
-            self.logger.log_event(
-                time=self.env.now,
+            log_event(
+                time=job.end_time,
                 event_type=EventType.END_SERVICE,
                 entity_id=job.id,
                 entity_type=job.job_type,
-                server_id=self.server_id,
-                queue_length=len(self.resource.queue),
-                extra_data={
-                    'service_time': service_time,
-                    'backup_time': backup_time,
-                    'total_processing_time': service_time + backup_time,
-                    'waiting_time': job.get_waiting_time(),
-                    'response_time': job.get_response_time()
-                }
+                server_id=server_id,
+                queue_length=len(queue),
+                extra_data=BackupServiceEndExtra(
+                    service_time, backup_time, service_time + backup_time,
+                    job.get_waiting_time(), job.get_response_time()
+                )
             )
+        finally:
+            # Place rendue, ou requête retirée de la file si le job a été
+            # interrompu pendant l'attente
+            self.resource.cancel(request)
+    
+    def run_native(self,
+                   arrival_times: np.ndarray,
+                   service_times: np.ndarray,
+                   backups: np.ndarray,
+                   duration: float):
+        """
+        Traite des jobs pré-tirés sans SimPy (statistiques seulement)
+        
+        Même comportement que process_with_backup pour une file FIFO à c
+        serveurs: chaque job commence au plus tôt à son arrivée, soit au
+        max(arrivée, première libération de serveur) (tas des instants de
+        libération), puis enchaîne backup et service. Seuls les backups et services
+        terminés avant `duration` sont comptés, comme avec env.run(until).
+        Aucun événement n'est journalisé.
+        
+        Le serveur doit être inactif (aucun job SimPy en service ou en
+        attente): tous les serveurs sont libres à partir de env.now.
+        
+        Args:
+            arrival_times: Instants d'arrivée croissants, à partir de env.now
+            service_times: Temps de service des jobs
+            backups: Décisions de backup des jobs (voir backup_mask)
+            duration: Durée de la simulation
+        """
+        if self.resource.count or self.resource.queue:
+            raise RuntimeError(f"Serveur {self.server_id} occupé: run_native exige un serveur inactif")
+        
+        free_at = [self.env.now] * self.resource.capacity
+        backup_time_generator = self.backup_time_generator
+        
+        for arrival, service_time, backup in zip(arrival_times.tolist(),
+                                                 service_times.tolist(),
+                                                 backups.tolist()):
+            # FIFO: les débuts de service sont croissants
+            start = max(arrival, free_at[0])
+            if start >= duration:
+                break
+            
+            end = start
+            if backup:
+                backup_time = backup_time_generator()
+                end += backup_time
+                if end < duration:
+                    self.jobs_backed_up += 1
+                    self.total_backup_time += backup_time
+            
+            end += service_time
+            if end < duration:
+                self.jobs_processed += 1
+                self.total_service_time += service_time
+            
+            heapq.heapreplace(free_at, end)
     
     def get_stats(self) -> dict:
         """Retourne les statistiques du serveur"""
@@ -220,7 +414,7 @@ class ReliableServer:
             'total_backup_time': self.total_backup_time,
             'total_service_time': self.total_service_time,
             'avg_backup_time': avg_backup_time,
-            'backup_strategy': str(self.backup_strategy)
+            'backup_strategy': self._strategy_repr
         }
 
 
@@ -231,14 +425,18 @@ class BackupComparison:
     
     def __init__(self,
                  env: simpy.Environment,
-                 logger: SimulationLogger):
+                 logger: SimulationLogger,
+                 rng: Optional[np.random.Generator] = None):
         """
         Args:
             env: Environnement SimPy
             logger: Logger centralisé
+            rng: Générateur NumPy pour les inter-arrivées et les temps de
+                 service, tirés par blocs (sinon module random)
         """
         self.env = env
         self.logger = logger
+        self.rng = rng
         self.servers = {}
     
     def add_server(self,
@@ -265,10 +463,45 @@ class BackupComparison:
         )
         self.servers[server_id] = server
     
+    def _arrival_times(self,
+                       arrival_rate: float,
+                       duration: float,
+                       rng: Optional[np.random.Generator]):
+        """
+        Instants d'arrivée d'un serveur jusqu'à `duration` (exclu)
+        
+        Avec un générateur NumPy, tous les instants sont tirés d'un coup
+        (poisson_arrival_times); sinon un par un sur le module random.
+        
+        Args:
+            arrival_rate: Taux d'arrivée λ
+            duration: Durée de la simulation
+            rng: Générateur NumPy du serveur, ou None
+            
+        Returns:
+            Itérable d'instants croissants
+        """
+        if rng is not None:
+            return poisson_arrival_times(arrival_rate, duration, rng,
+                                         start=self.env.now).tolist()
+        return self._sequential_arrival_times(arrival_rate, duration)
+    
+    def _sequential_arrival_times(self, arrival_rate: float, duration: float):
+        """Instants d'arrivée tirés un par un (module random)"""
+        interarrival_gen = make_exp_gen(arrival_rate)
+        time = self.env.now
+        while True:
+            time += interarrival_gen()
+            if time >= duration:
+                return
+            yield time
+    
     def run_comparison(self,
                       arrival_rate: float,
                       service_rate: float,
-                      duration: float) -> dict:
+                      duration: float,
+                      native: bool = False,
+                      seed: Optional[int] = None) -> dict:
         """
         Exécute une comparaison entre les stratégies
         
@@ -276,25 +509,59 @@ class BackupComparison:
             arrival_rate: Taux d'arrivée λ
             service_rate: Taux de service μ
             duration: Durée de la simulation
+            native: Tirer arrivées, services et décisions de backup par
+                    blocs NumPy et les traiter avec ReliableServer.run_native,
+                    sans SimPy ni journalisation (statistiques seulement;
+                    stratégies fournissant backup_mask). Les décisions sont
+                    tirées sur le générateur du serveur, pas sur celui de la
+                    stratégie (rng de RandomBackup): une même stratégie ne
+                    prend donc pas les mêmes décisions qu'en mode SimPy.
+                    Sans graine ni générateur de comparaison, le générateur
+                    est initialisé par le module random (reproductible avec
+                    SimulationEngine(random_seed=...))
+            seed: Nombres aléatoires communs: chaque serveur reçoit son
+                  propre générateur NumPy créé avec cette graine, donc les
+                  mêmes arrivées et temps de service que les autres
+                  (seule la stratégie diffère). Sinon générateur partagé
+                  de la comparaison.
             
         Returns:
             Dictionnaire avec les résultats pour chaque stratégie
         """
-        def service_time_gen():
-            return random.expovariate(service_rate)
+        if seed is not None:
+            rngs = {server_id: np.random.default_rng(seed) for server_id in self.servers}
+        else:
+            rngs = dict.fromkeys(self.servers, self.rng)
+        
+        if native:
+            # Graine tirée du module random, initialisé par le moteur
+            fallback_rng = np.random.default_rng(random.getrandbits(64))
+            results = {}
+            for server_id, server in self.servers.items():
+                rng = rngs[server_id] if rngs[server_id] is not None else fallback_rng
+                arrival_times = poisson_arrival_times(arrival_rate, duration, rng,
+                                                      start=self.env.now)
+                n = arrival_times.size
+                server.run_native(arrival_times,
+                                  rng.exponential(1.0 / service_rate, n),
+                                  server.backup_strategy.backup_mask(n, rng),
+                                  duration)
+                results[server_id] = server.get_stats()
+            return results
+        
+        shared_service_time_gen = _exp_gen(service_rate, self.rng)
         
         # Générateur d'arrivées pour chaque serveur
         def arrivals_for_server(server_id: str):
             server = self.servers[server_id]
+            rng = rngs[server_id]
+            service_time_gen = (shared_service_time_gen if seed is None
+                                else _exp_gen(service_rate, rng))
             
-            while self.env.now < duration:
-                interarrival = random.expovariate(arrival_rate)
-                yield self.env.timeout(interarrival)
-                
-                if self.env.now >= duration:
-                    break
+            for arrival_time in self._arrival_times(arrival_rate, duration, rng):
+                yield self.env.timeout(arrival_time - self.env.now)
                 
-                job = Job(arrival_time=self.env.now, job_type="ING")
+                job = Job(self.env.now, "ING")
                 
                 self.logger.log_event(
                     time=self.env.now,
@@ -331,18 +598,23 @@ class FailureRecovery:
                  env: simpy.Environment,
                  logger: SimulationLogger,
                  failure_rate: float,
-                 recovery_time_generator: Callable[[], float]):
+                 recovery_time_generator: Callable[[], float],
+                 rng: Optional[np.random.Generator] = None):
         """
         Args:
             env: Environnement SimPy
             logger: Logger centralisé
             failure_rate: Taux de pannes (λ_failure)
             recovery_time_generator: Générateur de temps de récupération
+            rng: Générateur NumPy pour les temps avant panne, tirés par
+                 blocs (sinon module random)
         """
         self.env = env
         self.logger = logger
         self.failure_rate = failure_rate
         self.recovery_time_generator = recovery_time_generator
+        # Taux nul: aucune panne, donc rien à tirer
+        self._time_to_failure = _exp_gen(failure_rate, rng) if failure_rate > 0 else None
         
         self.is_operational = True
         self.total_downtime = 0.0
@@ -351,10 +623,15 @@ class FailureRecovery:
     def failure_process(self):
         """
         Processus simulant les pannes aléatoires
+        
+        Se termine immédiatement si le taux de pannes est nul.
         """
+        if self._time_to_failure is None:
+            return
+        
         while True:
             # Attente jusqu'à la prochaine panne
-            time_to_failure = random.expovariate(self.failure_rate)
+            time_to_failure = self._time_to_failure()
             yield self.env.timeout(time_to_failure)
             
             # Panne
@@ -364,12 +641,12 @@ class FailureRecovery:
             
             self.logger.log_event(
                 time=self.env.now,
-                event_type=EventType.REJECTION,  # Utilisation pour indiquer une panne
+                event_type=EventType.FAILURE,
                 entity_id=-1,
                 entity_type="SYSTEM",
                 server_id="failure_recovery",
                 queue_length=0,
-                extra_data={'event': 'failure', 'failure_number': self.failure_count}
+                extra_data=FailureExtra(self.failure_count)
             )
             
             # Temps de récupération
@@ -382,16 +659,12 @@ class FailureRecovery:
             
             self.logger.log_event(
                 time=self.env.now,
-                event_type=EventType.ARRIVAL,  # Utilisation pour indiquer une récupération
+                event_type=EventType.RECOVERY,
                 entity_id=-1,
                 entity_type="SYSTEM",
                 server_id="failure_recovery",
                 queue_length=0,
-                extra_data={
-                    'event': 'recovery',
-                    'downtime': recovery_time,
-                    'total_downtime': self.total_downtime
-                }
+                extra_data=RecoveryExtra(recovery_time, self.total_downtime)
             )
     
     def get_availability(self, simulation_time: float) -> float:
@@ -3,14 +3,26 @@
 Script de test global - exécute tous les tests
 """
 
+import io
+import os
 import sys
-import subprocess
+import argparse
+import importlib
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout, redirect_stderr
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
 
 def run_test_file(test_file: str) -> bool:
     """
-    Exécute un fichier de test
+    Exécute un fichier de test dans l'interpréteur courant
+    
+    Le module est importé (tests.<nom>) et sa fonction run_all_tests
+    appelée directement: pas de nouveau processus Python par fichier, et
+    les modules déjà importés (NumPy, pandas, src) sont partagés.
     
     Args:
         test_file: Chemin vers le fichier de test
@@ -19,19 +31,38 @@ def run_test_file(test_file: str) -> bool:
         True si les tests réussissent
     """
     try:
-        result = subprocess.run(
-            [sys.executable, test_file],
-            cwd=Path(__file__).parent.parent,
-            capture_output=False,
-            check=True
-        )
-        return result.returncode == 0
-    except subprocess.CalledProcessError:
+        module = importlib.import_module(f"tests.{Path(test_file).stem}")
+        return bool(module.run_all_tests())
+    except Exception:
+        traceback.print_exc()
         return False
 
 
-def main():
-    """Exécute tous les tests"""
+def run_test_file_captured(test_file: str):
+    """
+    Exécute un fichier de test en capturant sa sortie (processus du pool)
+    
+    Args:
+        test_file: Chemin vers le fichier de test
+        
+    Returns:
+        Tuple (succès, sortie du fichier)
+    """
+    output = io.StringIO()
+    with redirect_stdout(output), redirect_stderr(output):
+        success = run_test_file(test_file)
+    return success, output.getvalue()
+
+
+def main(jobs: int = 1):
+    """
+    Exécute tous les tests
+    
+    Args:
+        jobs: Nombre de fichiers exécutés en parallèle (processus séparés,
+              sorties affichées dans l'ordre des fichiers); 1 pour tout
+              exécuter dans l'interpréteur courant
+    """
     print("\n" + "="*60)
     print("  EXÉCUTION DE TOUS LES TESTS")
     print("="*60 + "\n")
@@ -41,16 +72,26 @@ def main():
         "test_core.py",
         "test_capacity.py",
         "test_reliability.py",
-        "test_regulation.py"
+        "test_regulation.py",
+        "test_analysis.py"
     ]
     
     results = {}
+    found = [f for f in test_files if (tests_dir / f).exists()]
+    
+    pool = ProcessPoolExecutor(max_workers=min(jobs, len(found))) if jobs > 1 and found else None
+    futures = {}
+    if pool is not None:
+        futures = {f: pool.submit(run_test_file_captured, str(tests_dir / f)) for f in found}
     
     for test_file in test_files:
-        test_path = tests_dir / test_file
-        if test_path.exists():
+        if test_file in found:
             print(f"Exécution de {test_file}...")
-            success = run_test_file(str(test_path))
+            if pool is not None:
+                success, output = futures[test_file].result()
+                print(output, end="")
+            else:
+                success = run_test_file(str(tests_dir / test_file))
             results[test_file] = success
             
             if not success:
@@ -59,6 +100,9 @@ def main():
             print(f"⚠ {test_file} introuvable\n")
             results[test_file] = False
     
+    if pool is not None:
+        pool.shutdown()
+    
     # Résumé
     print("\n" + "="*60)
     print("  RÉSUMÉ DES TESTS")
@@ -78,5 +122,10 @@ def main():
 
 
 if __name__ == '__main__':
-    success = main()
+    parser = argparse.ArgumentParser(description="Exécute tous les tests")
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                        help="Fichiers de test exécutés en parallèle (1: séquentiel)")
+    args = parser.parse_args()
+    
+    success = main(args.jobs)
     sys.exit(0 if success else 1)
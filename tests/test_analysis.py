@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour le module Analysis
+"""
+
+import sys
+import random
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core import SimulationEngine, Server, JobGenerator
+from src.analysis import (
+    PerformanceAnalyzer, Visualizer, WarmupDetector, RealDataComparator,
+    ConfidenceInterval
+)
+
+
+def _run_basic_simulation(as_arrays=False):
+    """Lance une petite simulation M/M/1 et retourne ses événements"""
+    engine = SimulationEngine(random_seed=42)
+    
+    server = Server(
+        env=engine.env,
+        server_id="analysis_server",
+        num_servers=1,
+        logger=engine.logger
+    )
+    
+    generator = JobGenerator(
+        env=engine.env,
+        logger=engine.logger,
+        arrival_rate=2.0,
+        job_type="ING"
+    )
+    
+    def service_time_gen():
+        return random.expovariate(3.0)
+    
+    engine.env.process(generator.generate(server, service_time_gen, 100.0))
+    engine.run(100.0)
+    
+    return engine.get_results_soa() if as_arrays else engine.get_results()
+
+
+def test_performance_summary():
+    """Test du résumé de performances"""
+    print("Test: Résumé de performances...")
+    
+    df = _run_basic_simulation()
+    analyzer = PerformanceAnalyzer(df)
+    summary = analyzer.get_summary(num_servers=1)
+    
+    completed = df[df['event_type'] == 'end_service']
+    expected_throughput = len(completed) / completed['time'].max()
+    
+    assert abs(summary['throughput'] - expected_throughput) < 1e-9, "Débit incorrect"
+    assert 0.0 < summary['utilization'] <= 1.0, "Utilisation hors bornes"
+    assert summary['rejection_rate'] == 0.0, "Aucun rejet attendu"
+    
+    waiting = completed['waiting_time']
+    assert abs(summary['waiting_time']['mean'] - waiting.mean()) < 1e-9
+    assert abs(summary['waiting_time']['p95'] - waiting.quantile(0.95)) < 1e-9
+    assert abs(summary['response_time']['std'] - completed['response_time'].std()) < 1e-9
+    
+    print(f"  ✓ Débit: {summary['throughput']:.4f}")
+    print(f"  ✓ Utilisation: {summary['utilization']:.2%}")
+    print(f"  ✓ Attente moyenne: {summary['waiting_time']['mean']:.4f}")
+
+
+def test_soa_results():
+    """Test de l'analyse à partir des colonnes NumPy"""
+    print("Test: Résultats en colonnes NumPy...")
+    
+    results = _run_basic_simulation(as_arrays=True)
+    df = _run_basic_simulation()
+    
+    assert len(results['time']) == len(df)
+    assert results['event_code'].dtype == np.int8
+    assert results['queue_length'].dtype == np.int32
+    
+    summary = PerformanceAnalyzer(results).get_summary(num_servers=1)
+    expected = PerformanceAnalyzer(df).get_summary(num_servers=1)
+    
+    assert summary['throughput'] == expected['throughput'], "Débit différent"
+    assert summary['utilization'] == expected['utilization'], "Utilisation différente"
+    assert summary['waiting_time'] == expected['waiting_time'], "Attente différente"
+    assert summary['response_time'] == expected['response_time'], "Réponse différente"
+    
+    print(f"  ✓ {len(results['time'])} événements, résumé identique au DataFrame")
+
+
+def test_missing_event_types():
+    """Test d'un DataFrame sans fin de service"""
+    print("Test: Événements absents...")
+    
+    df = _run_basic_simulation()
+    arrivals_only = df[df['event_type'] == 'arrival']
+    analyzer = PerformanceAnalyzer(arrivals_only)
+    
+    assert analyzer.calculate_throughput() == 0.0
+    assert analyzer.calculate_utilization(num_servers=1) == 0.0
+    assert analyzer.calculate_waiting_time_stats()['mean'] == 0.0
+    assert analyzer.calculate_rejection_rate() == 0.0
+    
+    print("  ✓ Métriques nulles sans fin de service")
+
+
+def test_warmup_detection():
+    """Test de la détection de chauffe"""
+    print("Test: Détection de chauffe...")
+    
+    rng = np.random.default_rng(42)
+    # Tendance décroissante puis régime stationnaire
+    data = pd.Series(np.concatenate([
+        np.linspace(20.0, 5.0, 200) + rng.exponential(1.0, 200),
+        5.0 + rng.normal(0.0, 0.1, 800)
+    ]))
+    
+    expected_cv = data.rolling(window=50).std() / data.rolling(window=50).mean()
+    cv = WarmupDetector._rolling_cv(data.to_numpy(), 50)
+    assert np.allclose(cv, expected_cv.to_numpy(), equal_nan=True), "CV glissant incorrect"
+    
+    warmup = WarmupDetector.detect_warmup(data, window_size=50, threshold=0.05)
+    assert 100 <= warmup <= 250, f"Fin de chauffe {warmup} inattendue"
+    assert WarmupDetector.detect_warmup(data[:60], window_size=50) == 0
+    
+    print(f"  ✓ Fin de chauffe détectée à l'index {warmup}")
+
+
+def test_confidence_interval():
+    """Test des intervalles de confiance"""
+    print("Test: Intervalles de confiance...")
+    
+    from scipy import stats
+    
+    rng = np.random.default_rng(42)
+    for data in (rng.normal(10.0, 2.0, 12), rng.exponential(1.0, 500)):
+        mean, low, high = ConfidenceInterval.calculate_ci(data)
+        
+        if len(data) < 30:
+            quantile = stats.t.ppf(0.975, len(data) - 1)
+        else:
+            quantile = stats.norm.ppf(0.975)
+        margin = quantile * stats.sem(data)
+        
+        assert abs(mean - data.mean()) < 1e-12, "Moyenne incorrecte"
+        assert abs((high - low) / 2 - margin) < 1e-12, "Demi-largeur incorrecte"
+    
+    runs = [{'throughput': 1.0}, {'throughput': 2.0}, {'throughput': 3.0}, {}]
+    mean, low, high = ConfidenceInterval.calculate_multiple_runs_ci(runs, 'throughput')
+    assert mean == 2.0 and low < mean < high
+    
+    print(f"  ✓ IC 95% sur 3 runs: [{low:.4f}, {high:.4f}]")
+
+
+def test_arrival_rate_estimate():
+    """Test de l'estimation du taux d'arrivée réel"""
+    print("Test: Estimation du taux d'arrivée...")
+    
+    rng = np.random.default_rng(42)
+    offsets = np.cumsum(rng.exponential(20.0, 500))
+    ticks = np.datetime64('2024-01-01T00:00:00', 'ns') + (offsets * 1e9).astype('timedelta64[ns]')
+    real_df = pd.DataFrame({'receivedAt': pd.DatetimeIndex(ticks)})
+    
+    expected = 1.0 / RealDataComparator.interarrival_times(real_df).mean()
+    rate = RealDataComparator.estimate_arrival_rate(real_df)
+    
+    assert abs(rate - expected) < 1e-12, "Taux différent de 1 / moyenne des inter-arrivées"
+    assert RealDataComparator.estimate_arrival_rate(ticks) == rate
+    assert RealDataComparator.estimate_arrival_rate(ticks[:1]) == 0.0
+    
+    print(f"  ✓ λ estimé: {rate:.4f} (attendu ~0.05)")
+
+
+def test_full_report():
+    """Test de la génération du rapport complet"""
+    print("Test: Rapport complet...")
+    
+    df = _run_basic_simulation()
+    
+    with tempfile.TemporaryDirectory() as output_dir:
+        Visualizer(df).generate_full_report(output_dir, num_servers=1)
+        
+        for name in ("arrivals.png", "queue_length.png", "waiting_time.png",
+                     "response_time_by_type.png", "summary.txt"):
+            path = Path(output_dir) / name
+            assert path.exists() and path.stat().st_size > 0, f"{name} manquant"
+        
+        summary = (Path(output_dir) / "summary.txt").read_text()
+        assert "=== RAPPORT D'ANALYSE ===" in summary
+        assert "Temps de réponse:" in summary
+    
+    print("  ✓ Graphiques et résumé générés")
+
+
+def run_all_tests():
+    """Exécute tous les tests"""
+    print("\n" + "="*60)
+    print("  TESTS MODULE ANALYSIS")
+    print("="*60 + "\n")
+    
+    try:
+        test_performance_summary()
+        print()
+        test_soa_results()
+        print()
+        test_missing_event_types()
+        print()
+        test_warmup_detection()
+        print()
+        test_confidence_interval()
+        print()
+        test_arrival_rate_estimate()
+        print()
+        test_full_report()
+        print()
+        
+        print("="*60)
+        print("  ✓ TOUS LES TESTS RÉUSSIS")
+        print("="*60 + "\n")
+        return True
+    
+    except AssertionError as e:
+        print(f"\n✗ ÉCHEC: {e}\n")
+        return False
+    except Exception as e:
+        print(f"\n✗ ERREUR: {e}\n")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+if __name__ == '__main__':
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
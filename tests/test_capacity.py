@@ -49,6 +49,49 @@ def test_limited_queue():
     assert stats['total_arrivals'] > 0, "Aucune arrivée"
 
 
+def test_interrupted_jobs():
+    """Test des jobs interrompus dans la file limitée"""
+    print("Test: Jobs interrompus...")
+    
+    engine = SimulationEngine(random_seed=42)
+    queue = LimitedQueue(
+        env=engine.env,
+        queue_id="test_queue",
+        max_queue_size=1,
+        num_servers=1,
+        logger=engine.logger
+    )
+    
+    # Un job en service et un en attente, tous deux interrompus
+    processes = [
+        engine.env.process(queue.process_job(Job(0.0, "ING"), lambda: 5.0))
+        for _ in range(2)
+    ]
+    
+    def interrupter():
+        yield engine.env.timeout(1.0)
+        for process in reversed(processes):
+            process.interrupt()
+    
+    def late_arrival():
+        yield engine.env.timeout(2.0)
+        yield engine.env.process(queue.process_job(Job(engine.env.now, "ING"), lambda: 1.0))
+    
+    engine.env.process(interrupter())
+    engine.env.process(late_arrival())
+    # Les interruptions stoppent leurs processus: l'erreur est attendue
+    for process in processes:
+        process.defused = True
+    engine.run(10.0)
+    
+    assert queue.total_rejections == 0, "Capacité non rendue après interruption"
+    assert queue.jobs_completed == 1
+    assert queue.get_total_in_system() == 0
+    assert queue.resource.count == 0 and len(queue.resource.queue) == 0
+    
+    print("  ✓ Capacité rendue après interruption en attente et en service")
+
+
 def test_loss_system():
     """Test du système avec perte"""
     print("Test: Loss System...")
@@ -106,6 +149,57 @@ def test_waterfall_comparison():
     
     assert results['limited_queue']['total_arrivals'] > 0
     assert results['loss_system']['total_arrivals'] > 0
+    
+    # Flux d'arrivées commun aux deux systèmes
+    assert results['limited_queue']['total_arrivals'] == results['loss_system']['total_arrivals']
+
+
+def test_analytic_formulas():
+    """Test des formules analytiques (Erlang B, M/M/c/K)"""
+    print("Test: Formules analytiques...")
+    
+    # Erlang B, a = 1.2, c = 2: (a²/2) / (1 + a + a²/2)
+    expected = 0.72 / 2.92
+    assert abs(LossSystem.analytic_blocking(1.2, 2) - expected) < 1e-12, "Erlang B incorrect"
+    
+    # Sans file d'attente, M/M/c/K se réduit à Erlang B
+    assert abs(LimitedQueue.analytic_rejection(1.2, 2, 0) - expected) < 1e-12
+    assert LimitedQueue.analytic_rejection(1.2, 2, 5) < expected
+    
+    engine = SimulationEngine(random_seed=42)
+    scenario = WaterfallScenario(env=engine.env, logger=engine.logger, num_servers=2, max_queue_size=5)
+    analytic = scenario.run_comparison(3.0, 2.5, 1000.0, mode='analytic')['analytic']
+    assert engine.env.now == 0.0, "Le mode analytique ne doit pas simuler"
+    
+    results = scenario.run_comparison(3.0, 2.5, 2000.0, mode='both')
+    simulated = results['comparison']['loss_blocking_probability']
+    assert abs(simulated - analytic['loss_blocking_probability']) < 0.03
+    
+    print(f"  ✓ Erlang B: {analytic['loss_blocking_probability']:.4f} (simulé {simulated:.4f})")
+    print(f"  ✓ M/M/c/K: {analytic['queue_rejection_rate']:.4f}")
+
+
+def test_sweep():
+    """Test du balayage de paramètres en parallèle"""
+    print("Test: Balayage de paramètres...")
+    
+    grid = [{'lambda': rate, 'mu': 2.0, 'c': 2, 'K': 5, 'T': 200.0} for rate in (1.0, 3.0, 5.0)]
+    
+    sequential = WaterfallScenario.sweep(grid, n_workers=1, seed=42)
+    parallel = WaterfallScenario.sweep(grid, n_workers=2, seed=42)
+    
+    assert len(parallel) == len(grid)
+    for seq, par in zip(sequential, parallel):
+        assert seq['limited_queue'] == par['limited_queue'], "Résultats non reproductibles"
+    
+    rates = [results['comparison']['queue_rejection_rate'] for results in parallel]
+    assert rates[0] <= rates[-1], "Le rejet doit croître avec la charge"
+    
+    # Graines distinctes par point
+    arrivals = {results['limited_queue']['total_arrivals'] for results in parallel}
+    assert len(arrivals) == len(grid)
+    
+    print(f"  ✓ {len(grid)} points, taux de rejet: " + ", ".join(f"{r:.3f}" for r in rates))
 
 
 def run_all_tests():
@@ -117,10 +211,16 @@ def run_all_tests():
     try:
         test_limited_queue()
         print()
+        test_interrupted_jobs()
+        print()
         test_loss_system()
         print()
         test_waterfall_comparison()
         print()
+        test_analytic_formulas()
+        print()
+        test_sweep()
+        print()
         
         print("="*60)
         print("  ✓ TOUS LES TESTS RÉUSSIS")
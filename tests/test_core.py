@@ -4,14 +4,19 @@ Tests unitaires pour le module Core
 """
 
 import sys
+import math
 import random
 from pathlib import Path
 
 # Ajout du répertoire racine au PYTHONPATH
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import numpy as np
+import simpy
+
 from src.core import (
-    SimulationEngine, Job, Server, JobGenerator, EventType
+    SimulationEngine, SimulationLogger, Job, Server, JobGenerator, EventType,
+    FastResource, exp_stream, make_exp_gen, poisson_arrival_times
 )
 
 
@@ -71,11 +76,28 @@ def test_simulation_engine():
     print(f"  ✓ Durée: {summary['simulation_duration']:.2f}")
 
 
+def test_job_ids_reset():
+    """Test de la remise à zéro des identifiants de jobs"""
+    print("Test: Identifiants de jobs...")
+    
+    engine = SimulationEngine()
+    first, second = Job(0.0), Job(1.0)
+    assert second.id == first.id + 1, "Identifiants non consécutifs"
+    
+    engine.reset()
+    assert Job(2.0).id == 0, "reset() doit remettre les identifiants à zéro"
+    
+    print("  ✓ Identifiants consécutifs, remis à zéro par reset()")
+
+
 def test_job_metrics():
     """Test des métriques de jobs"""
     print("Test: Métriques de jobs...")
     
     job = Job(arrival_time=10.0, job_type="ING")
+    assert math.isnan(job.get_waiting_time()), "Attente non définie attendue (NaN)"
+    assert math.isnan(job.get_response_time()), "Réponse non définie attendue (NaN)"
+    
     job.start_time = 15.0
     job.service_time = 5.0
     job.end_time = 20.0
@@ -87,6 +109,245 @@ def test_job_metrics():
     print("  ✓ Temps de réponse: 10.0")
 
 
+def test_logger_columns():
+    """Test du stockage par colonnes du logger"""
+    print("Test: Logger par colonnes...")
+    
+    logger = SimulationLogger()
+    logger.log_event(0.5, EventType.ARRIVAL, 0, "ING", "s1", 0)
+    logger.log_event(1.0, EventType.REJECTION, 1, "PREPA", None, None,
+                     extra_data={'rejection_reason': 'queue_full'})
+    logger.log_event(2.0, "end_service", 0, "ING", "s1", 0,
+                     extra_data={'waiting_time': 0.0, 'response_time': 1.5})
+    
+    df = logger.get_dataframe()
+    
+    assert len(df) == len(logger) == 3
+    assert list(df.columns[:6]) == ['time', 'event_type', 'entity_id', 'entity_type',
+                                    'server_id', 'queue_length']
+    assert df['event_type'].tolist() == ['arrival', 'rejection', 'end_service']
+    assert df['queue_length'].isna().tolist() == [False, True, False]
+    assert df['rejection_reason'].isna().tolist() == [True, False, True]
+    assert df['response_time'].iloc[2] == 1.5
+    
+    summary = logger.get_summary()
+    assert summary['total_arrivals'] == 1 and summary['total_rejections'] == 1
+    assert summary['total_completed'] == 1 and summary['simulation_duration'] == 2.0
+    assert all(isinstance(value, int) for value in summary.values() if value != 2.0)
+    
+    logger.clear()
+    assert len(logger) == 0 and logger.get_dataframe().empty
+    assert logger.get_summary() == {}
+    
+    print("  ✓ Colonnes, valeurs absentes et remise à zéro")
+
+
+def test_verbose_events():
+    """Test de la consolidation des événements de service"""
+    print("Test: Événements de service consolidés...")
+    
+    def run(verbose_events):
+        engine = SimulationEngine(random_seed=42, verbose_events=verbose_events)
+        server = Server(engine.env, "test_server", 1, engine.logger)
+        generator = JobGenerator(engine.env, engine.logger, 2.0)
+        engine.env.process(generator.generate(server, lambda: 0.4, 50.0))
+        engine.run(50.0)
+        return engine.get_results()
+    
+    compact = run(False)
+    verbose = run(True)
+    
+    completed = compact[compact['event_type'] == 'end_service']
+    assert 'start_service' not in set(compact['event_type'])
+    assert (verbose['event_type'] == 'start_service').sum() >= len(completed)
+    assert len(compact) < len(verbose)
+    
+    # La ligne de fin porte le début de service
+    waiting = completed['start_time'] - (completed['time'] - completed['response_time'])
+    assert (waiting - completed['waiting_time']).abs().max() < 1e-9
+    
+    print(f"  ✓ {len(compact)} lignes au lieu de {len(verbose)}")
+
+
+def test_fast_resource():
+    """Test de la ressource à capacité fixe"""
+    print("Test: Ressource allégée...")
+    
+    engine = SimulationEngine()
+    resource = FastResource(engine.env, 2)
+    starts = {}
+    
+    def user(name, duration):
+        yield resource.request()
+        try:
+            starts[name] = engine.env.now
+            yield engine.env.timeout(duration)
+        finally:
+            resource.release()
+    
+    for name, duration in (("a", 3.0), ("b", 1.0), ("c", 1.0), ("d", 1.0)):
+        engine.env.process(user(name, duration))
+    
+    engine.env.run(until=0.5)
+    assert resource.count == 2 and len(resource.queue) == 2
+    
+    engine.run(10.0)
+    assert starts == {"a": 0.0, "b": 0.0, "c": 1.0, "d": 2.0}, f"Ordre FIFO incorrect: {starts}"
+    assert resource.count == 0 and len(resource.queue) == 0
+    
+    print("  ✓ Capacité respectée, file FIFO, places libérées")
+    
+    # Interruption pendant l'attente: la requête abandonnée est retirée
+    engine = SimulationEngine()
+    resource = FastResource(engine.env, 1)
+    starts = {}
+    
+    def waiting_user(name):
+        request = resource.request()
+        try:
+            yield request
+        except simpy.Interrupt:
+            resource.cancel(request)
+            return
+        try:
+            starts[name] = engine.env.now
+            yield engine.env.timeout(1.0)
+        finally:
+            resource.release()
+    
+    processes = {name: engine.env.process(waiting_user(name)) for name in "abc"}
+    
+    def interrupter():
+        yield engine.env.timeout(0.5)
+        processes["b"].interrupt()
+    
+    engine.env.process(interrupter())
+    engine.run(10.0)
+    assert starts == {"a": 0.0, "c": 1.0}, f"Requête abandonnée servie: {starts}"
+    assert resource.count == 0 and len(resource.queue) == 0
+    
+    # Place déjà attribuée mais pas encore reprise: cancel() la libère
+    request = resource.request()
+    resource.cancel(request)
+    assert resource.count == 0
+    
+    print("  ✓ Requête abandonnée retirée de la file")
+
+
+def test_interrupted_server_jobs():
+    """Test d'un job interrompu dans la file du serveur"""
+    print("Test: Job interrompu en attente...")
+    
+    engine = SimulationEngine(random_seed=42)
+    server = Server(env=engine.env, server_id="test_server", num_servers=1, logger=engine.logger)
+    
+    # Un job en service, un job en attente interrompu
+    engine.env.process(server.process(Job(0.0, "ING"), lambda: 5.0))
+    waiting = engine.env.process(server.process(Job(0.0, "ING"), lambda: 5.0))
+    # L'interruption stoppe le processus: l'erreur est attendue
+    waiting.defused = True
+    
+    def interrupter():
+        yield engine.env.timeout(1.0)
+        waiting.interrupt()
+    
+    def late_arrival():
+        yield engine.env.timeout(20.0)
+        yield engine.env.process(server.process(Job(engine.env.now, "ING"), lambda: 1.0))
+    
+    engine.env.process(interrupter())
+    engine.env.process(late_arrival())
+    engine.run(40.0)
+    
+    assert server.jobs_processed == 2, "Place attribuée au job interrompu"
+    assert server.resource.count == 0 and len(server.resource.queue) == 0
+    
+    print("  ✓ Requête du job interrompu retirée, serveur libéré")
+
+
+def test_generator_rng():
+    """Test du générateur aléatoire propre à un JobGenerator"""
+    print("Test: Générateur aléatoire du JobGenerator...")
+    
+    def arrival_times(seed, make_rng=random.Random):
+        engine = SimulationEngine()
+        server = Server(engine.env, "rng_server", 1, engine.logger)
+        generator = JobGenerator(engine.env, engine.logger, 2.0, rng=make_rng(seed))
+        engine.env.process(generator.generate(server, lambda: 0.1, 50.0))
+        
+        # L'état global du module random ne doit pas influencer le flux
+        random.seed()
+        engine.run(50.0)
+        
+        df = engine.get_results()
+        return df[df['event_type'] == 'arrival']['time'].tolist()
+    
+    first = arrival_times(7)
+    assert first == arrival_times(7), "Arrivées non reproductibles"
+    assert first != arrival_times(8), "Graines différentes, arrivées identiques"
+    
+    # Inter-arrivées tirées par blocs avec un générateur NumPy
+    blocks = arrival_times(7, np.random.default_rng)
+    assert blocks == arrival_times(7, np.random.default_rng), "Arrivées NumPy non reproductibles"
+    assert 60 < len(blocks) < 140, f"{len(blocks)} arrivées pour λ=2 sur 50 unités"
+    
+    print(f"  ✓ {len(first)} arrivées reproductibles ({len(blocks)} avec NumPy)")
+
+
+def test_exp_stream():
+    """Test du flux de variables exponentielles"""
+    print("Test: Flux exponentiel...")
+    
+    stream = exp_stream(4.0, np.random.default_rng(42), chunk=1000)
+    samples = [next(stream) for _ in range(5000)]
+    
+    assert all(isinstance(x, float) and x > 0 for x in samples)
+    mean = sum(samples) / len(samples)
+    assert abs(mean - 0.25) < 0.02, f"Moyenne {mean:.4f} trop éloignée de 1/λ"
+    
+    replay = exp_stream(4.0, np.random.default_rng(42), chunk=1000)
+    assert [next(replay) for _ in range(5000)] == samples, "Flux non reproductible"
+    
+    # Flux du moteur: générateur partagé, mêmes tirages quelle que soit la taille des blocs
+    engine = SimulationEngine(random_seed=42)
+    engine_stream = engine.exp_stream(4.0)
+    assert [next(engine_stream) for _ in range(5000)] == samples
+    
+    engine.reset()
+    engine_stream = engine.exp_stream(4.0, chunk=64)
+    assert [next(engine_stream) for _ in range(5000)] == samples, "reset() doit rejouer le flux"
+    
+    print(f"  ✓ Moyenne: {mean:.4f} (attendu 0.25)")
+
+
+def test_make_exp_gen():
+    """Test du générateur exponentiel spécialisé"""
+    print("Test: Générateur exponentiel spécialisé...")
+    
+    gen = make_exp_gen(4.0, random.Random(42))
+    reference = random.Random(42)
+    
+    for _ in range(1000):
+        expected = reference.expovariate(4.0)
+        assert abs(gen() - expected) < 1e-12, "Inversion de la CDF incorrecte"
+    
+    print("  ✓ Identique à random.expovariate")
+
+
+def test_poisson_arrival_times():
+    """Test des instants d'arrivée précalculés"""
+    print("Test: Instants d'arrivée poissoniens...")
+    
+    times = poisson_arrival_times(5.0, 1000.0, np.random.default_rng(42), start=10.0)
+    
+    assert times[0] > 10.0 and times[-1] < 1000.0, "Instants hors de l'horizon"
+    assert np.all(np.diff(times) > 0), "Instants non croissants"
+    assert abs(len(times) - 5.0 * 990.0) < 4 * np.sqrt(5.0 * 990.0), f"{len(times)} arrivées"
+    assert len(poisson_arrival_times(5.0, 10.0, np.random.default_rng(42), start=10.0)) == 0
+    
+    print(f"  ✓ {len(times)} arrivées (attendu ~{5.0 * 990.0:.0f})")
+
+
 def run_all_tests():
     """Exécute tous les tests"""
     print("\n" + "="*60)
@@ -98,8 +359,26 @@ def run_all_tests():
         print()
         test_job_metrics()
         print()
+        test_job_ids_reset()
+        print()
         test_simulation_engine()
         print()
+        test_logger_columns()
+        print()
+        test_verbose_events()
+        print()
+        test_fast_resource()
+        print()
+        test_interrupted_server_jobs()
+        print()
+        test_generator_rng()
+        print()
+        test_exp_stream()
+        print()
+        test_make_exp_gen()
+        print()
+        test_poisson_arrival_times()
+        print()
         
         print("="*60)
         print("  ✓ TOUS LES TESTS RÉUSSIS")
@@ -7,11 +7,13 @@ import sys
 import random
 from pathlib import Path
 
+import numpy as np
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.core import SimulationEngine
 from src.regulation import (
-    PriorityQueue, GatingController, HeterogeneousServer, ChannelsScenario
+    PriorityQueue, Policy, GatingController, HeterogeneousServer, ChannelsScenario
 )
 from src.core import Job
 
@@ -62,6 +64,59 @@ def test_priority_queue():
     print("  ✓ Priority fonctionne")
 
 
+def test_sjf_heap():
+    """Test de la file SJF en tas binaire"""
+    print("Test: File SJF (tas)...")
+    
+    queue = PriorityQueue("SJF")
+    assert queue.policy is Policy.SJF
+    service_times = [5.0, 2.0, 8.0, 2.0, None, 1.0]
+    jobs = []
+    for i, service_time in enumerate(service_times):
+        job = Job(arrival_time=float(i))
+        if service_time is not None:
+            job.service_time = service_time
+        jobs.append(job)
+        queue.add(job)
+    
+    assert len(queue) == len(jobs)
+    order = [queue.get_next_sjf() for _ in jobs]
+    
+    # Plus court d'abord, FIFO à égalité, jobs sans temps de service en dernier
+    assert order == [jobs[5], jobs[1], jobs[3], jobs[0], jobs[2], jobs[4]]
+    assert queue.get_next_sjf() is None and len(queue) == 0
+    
+    print("  ✓ Ordre SJF, égalités en FIFO")
+
+
+def test_priority_buckets():
+    """Test de la file PRIORITY par types (buckets)"""
+    print("Test: File PRIORITY (buckets)...")
+    
+    queue = PriorityQueue(Policy.PRIORITY)
+    jobs = [Job(arrival_time=float(i), job_type=job_type)
+            for i, job_type in enumerate(["PREPA", "OTHER", "ING", "PREPA", "EXT", "ING"])]
+    for job in jobs:
+        queue.add(job)
+    
+    assert len(queue) == len(jobs)
+    order = [queue.get_next_priority(("ING", "PREPA")) for _ in jobs]
+    
+    # Types prioritaires dans l'ordre, FIFO par type, puis les autres par ancienneté
+    assert order == [jobs[2], jobs[5], jobs[0], jobs[3], jobs[1], jobs[4]]
+    assert queue.get_next_priority(("ING", "PREPA")) is None and len(queue) == 0
+    
+    # Ordre de priorité configurable sur le serveur
+    engine = SimulationEngine(random_seed=42)
+    server = HeterogeneousServer(engine.env, "prio", 1, engine.logger,
+                                 scheduling_policy="PRIORITY", priority_order=("PREPA", "ING"))
+    server.custom_queue.add(jobs[2])
+    server.custom_queue.add(jobs[0])
+    assert server._dispatch() is jobs[0], "PREPA devrait passer en premier"
+    
+    print("  ✓ Ordre par priorité de type, FIFO par type")
+
+
 def test_gating_controller():
     """Test du contrôleur de gating"""
     print("Test: Gating Controller...")
@@ -83,6 +138,44 @@ def test_gating_controller():
     print("  ✓ Gating Controller fonctionne")
 
 
+def test_gating_overlapping_intervals():
+    """Test du gating avec intervalles chevauchants"""
+    print("Test: Gating avec intervalles chevauchants...")
+    
+    engine = SimulationEngine(random_seed=42)
+    
+    # Fermeture continue de t=10 à t=25, puis de t=30 à t=40
+    gating = GatingController(
+        env=engine.env,
+        gating_intervals=[(30.0, 40.0), (15.0, 25.0), (10.0, 15.0), (12.0, 14.0)]
+    )
+    
+    assert gating.is_open(9.9) and not gating.is_open(10.0)
+    assert not gating.is_open(15.0) and not gating.is_open(24.9)
+    assert gating.is_open(25.0) and gating.is_open(45.0)
+    
+    # Requêtes vectorisées identiques aux requêtes unitaires
+    times = np.linspace(0.0, 50.0, 501)
+    expected = [gating.next_open_time(t) for t in times]
+    assert gating.next_open_times(times).tolist() == expected
+    assert gating.final_closing_time(35.0) == 30.0
+    assert gating.final_closing_time(28.0) == 28.0
+    
+    opened_at = []
+    
+    def job():
+        yield engine.env.timeout(12.0)
+        yield engine.env.process(gating.wait_until_open())
+        opened_at.append(engine.env.now)
+    
+    engine.env.process(job())
+    engine.run(50.0)
+    
+    assert opened_at == [25.0], f"Réouverture attendue à t=25, obtenue {opened_at}"
+    
+    print("  ✓ Intervalles fusionnés, réouverture à t=25")
+
+
 def test_heterogeneous_server():
     """Test du serveur hétérogène"""
     print("Test: Serveur hétérogène...")
@@ -104,21 +197,84 @@ def test_heterogeneous_server():
         for i in range(5):
             yield engine.env.timeout(random.expovariate(2.0))
             job = Job(arrival_time=engine.env.now, job_type="ING")
-            engine.env.process(server.process_job(job, service_time_gen))
+            job.service_time = service_time_gen()
+            engine.env.process(server.process_job(job))
         
         for i in range(5):
             yield engine.env.timeout(random.expovariate(2.0))
             job = Job(arrival_time=engine.env.now, job_type="PREPA")
-            engine.env.process(server.process_job(job, service_time_gen))
+            job.service_time = service_time_gen()
+            engine.env.process(server.process_job(job))
     
     engine.env.process(arrivals())
     engine.run(20.0)
     
     stats = server.get_stats()
+    
+    # Moyennes vectorisées, indexées par identifiant de type
+    averages = server.get_averages()
+    for type_id, job_type in enumerate(server.job_types):
+        assert averages['avg_response_time'][type_id] == stats['by_type'][job_type]['avg_response_time']
+    
     print(f"  ✓ ING complétés: {stats['by_type'].get('ING', {}).get('completed', 0)}")
     print(f"  ✓ PREPA complétés: {stats['by_type'].get('PREPA', {}).get('completed', 0)}")
 
 
+def test_server_without_logging():
+    """Test du serveur hétérogène sans journalisation des événements"""
+    print("Test: Serveur sans journalisation...")
+    
+    def run(log_events):
+        engine = SimulationEngine(random_seed=42)
+        server = HeterogeneousServer(engine.env, "quiet", 2, engine.logger,
+                                     log_events=log_events)
+        
+        def arrivals():
+            for i in range(20):
+                yield engine.env.timeout(random.expovariate(2.0))
+                job = Job(arrival_time=engine.env.now, job_type="ING")
+                job.service_time = random.expovariate(3.0)
+                engine.env.process(server.process_job(job))
+        
+        engine.env.process(arrivals())
+        engine.run(50.0)
+        return server.get_stats(), len(engine.logger)
+    
+    stats, num_events = run(log_events=False)
+    
+    # Données des services journalisées par dataclass, en colonnes dans le DataFrame
+    engine = SimulationEngine(random_seed=42)
+    scenario = ChannelsScenario(engine.env, engine.logger, num_servers=2, scheduling_policy="SJF")
+    scenario.add_population("ING", arrival_rate=1.5, service_rate=2.5)
+    scenario.run(20.0)
+    df = engine.get_results()
+    ends = df[df['event_type'] == 'end_service']
+    assert {'scheduling_policy', 'service_time', 'waiting_time', 'response_time'} <= set(df.columns)
+    assert (df.loc[df['event_type'] == 'start_service', 'scheduling_policy'] == "SJF").all()
+    assert ((ends['response_time'] - ends['waiting_time'] - ends['service_time']).abs() < 1e-9).all()
+    logged_stats, logged_events = run(log_events=True)
+    
+    assert num_events == 0 and logged_events > 0
+    assert stats == logged_stats, "Les statistiques ne doivent pas dépendre du log"
+    
+    # Profilage par phase: mêmes statistiques, compteurs de temps réel en plus
+    engine = SimulationEngine(random_seed=42)
+    server = HeterogeneousServer(engine.env, "profiled", 2, engine.logger, profile=True)
+    for i in range(20):
+        job = Job(arrival_time=0.0, job_type="ING")
+        job.service_time = 0.5
+        engine.env.process(server.process_job(job))
+    engine.run(50.0)
+    
+    profiled = server.get_stats()
+    assert profiled['by_type']['ING']['completed'] == 20
+    assert set(profiled['perf_ns']) == {'dispatch', 'stats', 'log'}
+    assert all(ns > 0 for ns in profiled['perf_ns'].values())
+    assert 'perf_ns' not in stats
+    
+    print(f"  ✓ Statistiques identiques, {logged_events} événements évités")
+
+
 def test_channels_scenario():
     """Test du scénario Channels"""
     print("Test: Scénario Channels...")
@@ -142,6 +298,57 @@ def test_channels_scenario():
     
     assert results['by_type']['ING']['completed'] > 0
     assert results['by_type']['PREPA']['completed'] > 0
+    
+    # Tirages NumPy par blocs: reproductibles par graine
+    def run_numpy():
+        engine = SimulationEngine(random_seed=42)
+        scenario = ChannelsScenario(engine.env, engine.logger, num_servers=2, rng=engine.rng)
+        scenario.add_population("ING", arrival_rate=1.5, service_rate=2.5)
+        scenario.add_population("PREPA", arrival_rate=0.5, service_rate=2.0)
+        return scenario.run(50.0)
+    
+    numpy_results = run_numpy()
+    assert numpy_results == run_numpy(), "Tirages NumPy non reproductibles"
+    assert numpy_results['by_type']['ING']['completed'] > 0
+
+
+def test_native_event_loop():
+    """Test de la boucle d'événements native face à SimPy"""
+    print("Test: Boucle d'événements native...")
+    
+    def run(policy, native):
+        engine = SimulationEngine(random_seed=7)
+        scenario = ChannelsScenario(engine.env, engine.logger, num_servers=2,
+                                    scheduling_policy=policy, use_gating=True,
+                                    gating_intervals=[(20.0, 40.0), (100.0, 130.0)],
+                                    rng=engine.rng)
+        scenario.add_population("ING", arrival_rate=1.5, service_rate=2.5)
+        scenario.add_population("PREPA", arrival_rate=0.5, service_rate=2.0)
+        return scenario.run(300.0, native=native), len(engine.logger)
+    
+    for policy in ("FIFO", "SJF", "PRIORITY"):
+        simpy_stats, simpy_events = run(policy, native=False)
+        native_stats, native_events = run(policy, native=True)
+        
+        assert native_events == simpy_events, f"{policy}: nombre d'événements différent"
+        for job_type, expected in simpy_stats['by_type'].items():
+            stats = native_stats['by_type'][job_type]
+            assert stats['completed'] == expected['completed'], f"{policy}: complétés différents"
+            assert abs(stats['avg_waiting_time'] - expected['avg_waiting_time']) < 1e-9
+    
+    # Gating fermé jusqu'à la fin: plus aucun job généré
+    engine = SimulationEngine(random_seed=7)
+    scenario = ChannelsScenario(engine.env, engine.logger, num_servers=2,
+                                use_gating=True, gating_intervals=[(20.0, 60.0)],
+                                rng=engine.rng)
+    scenario.add_population("ING", arrival_rate=1.5, service_rate=2.5)
+    scenario.run(50.0)
+    population = scenario.populations["ING"]
+    assert population.jobs_generated == scenario.server.get_stats()['by_type']['ING']['arrivals']
+    assert engine.logger.get_summary()['total_arrivals'] == population.jobs_generated
+    
+    print("  ✓ Mêmes statistiques que SimPy (FIFO, SJF, PRIORITY, gating)")
+    print(f"  ✓ Génération arrêtée à la fermeture finale ({population.jobs_generated} jobs)")
 
 
 def run_all_tests():
@@ -153,12 +360,22 @@ def run_all_tests():
     try:
         test_priority_queue()
         print()
+        test_sjf_heap()
+        print()
+        test_priority_buckets()
+        print()
         test_gating_controller()
         print()
+        test_gating_overlapping_intervals()
+        print()
         test_heterogeneous_server()
         print()
+        test_server_without_logging()
+        print()
         test_channels_scenario()
         print()
+        test_native_event_loop()
+        print()
         
         print("="*60)
         print("  ✓ TOUS LES TESTS RÉUSSIS")
@@ -5,16 +5,35 @@ Tests unitaires pour le module Reliability
 
 import sys
 import random
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.core import SimulationEngine, Job
 from src.reliability import (
-    SystematicBackup, RandomBackup, ReliableServer, BackupComparison
+    SystematicBackup, RandomBackup, ReliableServer, BackupComparison,
+    FailureRecovery
 )
 
 
+@lru_cache(maxsize=4)
+def _cached_engine(seed: int) -> SimulationEngine:
+    return SimulationEngine(random_seed=seed)
+
+
+def _engine(seed: int) -> SimulationEngine:
+    """
+    Moteur partagé entre les tests (un par graine), remis à zéro à chaque
+    demande: même état qu'un moteur neuf, sans le reconstruire
+    """
+    engine = _cached_engine(seed)
+    engine.reset()
+    return engine
+
+
 def test_systematic_backup():
     """Test du backup systématique"""
     print("Test: Backup systématique...")
@@ -23,6 +42,7 @@ def test_systematic_backup():
     job = Job(arrival_time=0.0, job_type="ING")
     
     assert strategy.should_backup(job) == True, "Devrait toujours sauvegarder"
+    assert strategy.always_backup and not RandomBackup(0.5).always_backup
     print("  ✓ Backup systématique fonctionne")
 
 
@@ -30,79 +50,181 @@ def test_random_backup():
     """Test du backup aléatoire"""
     print("Test: Backup aléatoire...")
     
-    strategy = RandomBackup(backup_probability=0.5)
+    # Source random.Random propre au test: déterministe, sans état global
+    state = random.getstate()
+    strategy = RandomBackup(backup_probability=0.5, rng=random.Random(42))
+    job = Job(arrival_time=0.0, job_type="ING")
+    ratio = sum(strategy.should_backup(job) for _ in range(10_000)) / 10_000
+    assert 0.45 < ratio < 0.55, f"Ratio de backup {ratio:.4f} trop éloigné de 0.5"
+    assert random.getstate() == state, "État global du module random modifié"
+    
+    # Monte-Carlo vectorisé sur 100 000 décisions par probabilité
+    rng = np.random.default_rng(42)
+    for p in (0.1, 0.3, 0.5, 0.7, 0.9):
+        ratio = RandomBackup(p).backup_mask(100_000, rng).mean()
+        assert abs(ratio - p) < 0.01, f"Ratio de backup {ratio:.4f} trop éloigné de {p}"
+    print("  ✓ Backup aléatoire: ratios à ±1% pour p = 0.1 à 0.9")
+    
+    # Décisions tirées par blocs NumPy
+    def decisions():
+        strategy = RandomBackup(0.2, rng=np.random.default_rng(42))
+        job = Job(arrival_time=0.0, job_type="ING")
+        return [strategy.should_backup(job) for _ in range(1000)]
     
-    # Test sur plusieurs jobs
-    backups = 0
-    for i in range(100):
-        job = Job(arrival_time=i, job_type="ING")
-        if strategy.should_backup(job):
-            backups += 1
+    drawn = decisions()
+    assert drawn == decisions(), "Décisions NumPy non reproductibles"
+    assert 0.15 < sum(drawn) / 1000 < 0.25
+    print(f"  ✓ Backup aléatoire NumPy: {sum(drawn) / 1000:.2%} (attendu ~20%)")
     
-    # Devrait être proche de 50%
-    ratio = backups / 100
-    assert 0.3 < ratio < 0.7, f"Ratio de backup {ratio:.2f} trop éloigné de 0.5"
-    print(f"  ✓ Backup aléatoire: {ratio:.2%} (attendu ~50%)")
+    # Probabilités extrêmes: décision constante, sans tirage
+    state = random.getstate()
+    assert RandomBackup(1.0).always_backup
+    assert all(RandomBackup(1.0).should_backup(job) for _ in range(100))
+    assert not any(RandomBackup(0.0).should_backup(job) for _ in range(100))
+    assert random.getstate() == state, "Aucun tirage attendu"
+    print("  ✓ p=0 et p=1 sans tirage")
+
+
+def test_slotted_objects():
+    """Test de l'absence de __dict__ sur les objets créés par job"""
+    print("Test: Objets sans __dict__...")
+    
+    job = Job(arrival_time=0.0, job_type="ING")
+    assert hasattr(Job, '__slots__') and not hasattr(job, '__dict__'), "Job sans __slots__"
+    
+    engine = _engine(42)
+    server = ReliableServer(engine.env, "slots", 1, engine.logger, SystematicBackup(), lambda: 0.1)
+    assert not hasattr(server, '__dict__'), "ReliableServer sans __slots__"
+    
+    print("  ✓ Job et ReliableServer sans __dict__")
 
 
 def test_reliable_server():
-    """Test du serveur avec backup"""
+    """Test du serveur avec backup (une stratégie par cas, même moteur)"""
     print("Test: Serveur avec backup...")
     
-    engine = SimulationEngine(random_seed=42)
+    engine = _engine(42)
     
+    for strategy in (SystematicBackup(), RandomBackup(0.5)):
+        engine.reset()
+        
+        # Tirages faits d'avance par NumPy: une colonne par grandeur,
+        # indexée par numéro de job
+        interarrivals = np.random.default_rng(42).exponential(1 / 2.0, 10).tolist()
+        service_times = np.random.default_rng(43).exponential(1 / 3.0, 10).tolist()
+        backup_times = iter(np.random.default_rng(44).exponential(1 / 10.0, 10).tolist())
+        
+        server = ReliableServer(
+            env=engine.env,
+            server_id="reliable_test",
+            num_servers=2,
+            logger=engine.logger,
+            backup_strategy=strategy,
+            backup_time_generator=lambda: next(backup_times)
+        )
+        
+        def arrivals():
+            # Noms liés une fois en variables locales
+            env = engine.env
+            timeout, process = env.timeout, env.process
+            process_with_backup = server.process_with_backup
+            
+            for i, interarrival in enumerate(interarrivals):
+                yield timeout(interarrival)
+                job = Job(env.now, "ING")
+                # Temps de service propre au job i
+                process(process_with_backup(job, lambda i=i: service_times[i]))
+        
+        engine.env.process(arrivals())
+        engine.run(20.0)
+        
+        stats = server.get_stats()
+        if strategy.always_backup:
+            assert stats['jobs_backed_up'] == stats['jobs_processed'] > 0
+        
+        # Données supplémentaires (dataclasses) en colonnes du DataFrame
+        df = engine.get_results()
+        ends = df[df['event_type'] == 'end_service']
+        assert len(ends) == stats['jobs_processed']
+        assert (ends['total_processing_time'] == ends['service_time'] + ends['backup_time']).all()
+        
+        print(f"  ✓ {strategy}: {stats['jobs_processed']} jobs traités, "
+              f"{stats['jobs_backed_up']} sauvegardés ({stats['backup_rate']:.2%})")
+
+
+def test_interrupted_backup_jobs():
+    """Test d'un job interrompu dans la file du serveur avec backup"""
+    print("Test: Job interrompu en attente (backup)...")
+    
+    engine = _engine(42)
     server = ReliableServer(
         env=engine.env,
         server_id="reliable_test",
-        num_servers=2,
+        num_servers=1,
         logger=engine.logger,
-        backup_strategy=RandomBackup(0.5),
-        backup_time_generator=lambda: random.expovariate(10.0)
+        backup_strategy=SystematicBackup(),
+        backup_time_generator=lambda: 0.5
     )
     
-    def service_time_gen():
-        return random.expovariate(3.0)
+    # Un job en service, un job en attente interrompu
+    engine.env.process(server.process_with_backup(Job(0.0, "ING"), lambda: 5.0))
+    waiting = engine.env.process(server.process_with_backup(Job(0.0, "ING"), lambda: 5.0))
+    # L'interruption stoppe le processus: l'erreur est attendue
+    waiting.defused = True
     
-    def arrivals():
-        for i in range(10):
-            yield engine.env.timeout(random.expovariate(2.0))
-            job = Job(arrival_time=engine.env.now, job_type="ING")
-            engine.env.process(server.process_with_backup(job, service_time_gen))
+    def interrupter():
+        yield engine.env.timeout(1.0)
+        waiting.interrupt()
     
-    engine.env.process(arrivals())
-    engine.run(20.0)
+    def late_arrival():
+        yield engine.env.timeout(20.0)
+        job = Job(engine.env.now, "ING")
+        yield engine.env.process(server.process_with_backup(job, lambda: 1.0))
+    
+    engine.env.process(interrupter())
+    engine.env.process(late_arrival())
+    engine.run(40.0)
+    
+    assert server.jobs_processed == 2, "Place attribuée au job interrompu"
+    assert server.resource.count == 0 and len(server.resource.queue) == 0
     
-    stats = server.get_stats()
-    print(f"  ✓ Jobs traités: {stats['jobs_processed']}")
-    print(f"  ✓ Jobs sauvegardés: {stats['jobs_backed_up']}")
-    print(f"  ✓ Taux backup: {stats['backup_rate']:.2%}")
+    print("  ✓ Requête du job interrompu retirée, serveur libéré")
 
 
 def test_backup_comparison():
     """Test de comparaison des stratégies"""
     print("Test: Comparaison stratégies backup...")
     
-    engine = SimulationEngine(random_seed=42)
+    engine = _engine(42)
     comparison = BackupComparison(env=engine.env, logger=engine.logger)
     
+    # Temps de backup tirés d'avance par NumPy (largement plus que
+    # d'arrivées), même suite pour les deux stratégies (nombres aléatoires
+    # communs)
+    backup_times = np.random.default_rng(42).exponential(1 / 10.0, 1000).tolist()
+    systematic_backups = iter(backup_times)
+    random_backups = iter(backup_times)
+    
     comparison.add_server(
         "systematic",
         num_servers=2,
         backup_strategy=SystematicBackup(),
-        backup_time_generator=lambda: random.expovariate(10.0)
+        backup_time_generator=lambda: next(systematic_backups)
     )
     
     comparison.add_server(
         "random",
         num_servers=2,
         backup_strategy=RandomBackup(0.5),
-        backup_time_generator=lambda: random.expovariate(10.0)
+        backup_time_generator=lambda: next(random_backups)
     )
     
+    # Nombres aléatoires communs: mêmes arrivées et services pour les deux
     results = comparison.run_comparison(
         arrival_rate=2.0,
         service_rate=3.0,
-        duration=50.0
+        duration=25.0,
+        seed=42
     )
     
     print(f"  ✓ Systematic: {results['systematic']['jobs_processed']} jobs")
@@ -110,6 +232,135 @@ def test_backup_comparison():
     
     assert results['systematic']['jobs_processed'] > 0
     assert results['random']['jobs_processed'] > 0
+    assert results['systematic']['backup_rate'] > results['random']['backup_rate']
+    
+    # Deux stratégies identiques voient exactement la même simulation
+    for native in (False, True):
+        engine = _engine(42)
+        comparison = BackupComparison(env=engine.env, logger=engine.logger)
+        for server_id in ("a", "b"):
+            comparison.add_server(server_id, 2, SystematicBackup(), lambda: 0.1)
+        twins = comparison.run_comparison(2.0, 3.0, 25.0, native=native, seed=7)
+        del twins['a']['server_id'], twins['b']['server_id']
+        assert twins['a'] == twins['b'], "Nombres aléatoires non communs"
+    print("  ✓ Mêmes tirages pour chaque stratégie (SimPy et natif)")
+
+
+def test_numpy_draws():
+    """Test des tirages NumPy par blocs (comparaison et pannes)"""
+    print("Test: Tirages NumPy par blocs...")
+    
+    def run():
+        engine = _engine(42)
+        comparison = BackupComparison(env=engine.env, logger=engine.logger, rng=engine.rng)
+        comparison.add_server("systematic", 2, SystematicBackup(),
+                              backup_time_generator=lambda: 0.1)
+        recovery = FailureRecovery(engine.env, engine.logger, failure_rate=0.1,
+                                   recovery_time_generator=lambda: 1.0, rng=engine.rng)
+        engine.env.process(recovery.failure_process())
+        results = comparison.run_comparison(arrival_rate=2.0, service_rate=3.0, duration=50.0)
+        return results, recovery.get_stats(50.0)
+    
+    results, failures = run()
+    assert (results, failures) == run(), "Tirages NumPy non reproductibles"
+    assert results['systematic']['jobs_processed'] > 0
+    assert failures['failure_count'] > 0
+    
+    # Pannes journalisées avec leurs propres types, hors des arrivées et rejets
+    engine = _engine(42)
+    recovery = FailureRecovery(engine.env, engine.logger, failure_rate=0.5,
+                               recovery_time_generator=lambda: 1.0, rng=engine.rng)
+    engine.env.process(recovery.failure_process())
+    engine.run(50.0)
+    df = engine.get_results()
+    counts = df['event_type'].value_counts()
+    assert counts['failure'] == recovery.failure_count > 0
+    assert engine.logger.get_summary()['total_arrivals'] == 0
+    assert engine.logger.get_summary()['total_rejections'] == 0
+    assert (df.loc[df['event_type'] == 'recovery', 'downtime'] == 1.0).all()
+    
+    # Taux de pannes nul: le processus se termine sans panne
+    engine = _engine(42)
+    recovery = FailureRecovery(engine.env, engine.logger, failure_rate=0.0,
+                               recovery_time_generator=lambda: 1.0)
+    engine.env.process(recovery.failure_process())
+    engine.run(50.0)
+    assert recovery.failure_count == 0 and recovery.get_availability(50.0) == 1.0
+    
+    print(f"  ✓ {results['systematic']['jobs_processed']} jobs, "
+          f"{failures['failure_count']} pannes, reproductibles")
+
+
+def test_native_backup_loop():
+    """Test de la boucle native face à SimPy (mêmes tirages)"""
+    print("Test: Boucle native des backups...")
+    
+    rng = np.random.default_rng(7)
+    arrival_times = np.cumsum(rng.exponential(0.5, 150))
+    service_times = rng.exponential(1.0 / 3.0, 150)
+    duration = 60.0
+    
+    # SimPy, avec les mêmes arrivées et temps de service
+    engine = _engine(7)
+    simpy_server = ReliableServer(engine.env, "simpy", 2, engine.logger,
+                                  SystematicBackup(), lambda: 0.1)
+    service_iter = iter(service_times.tolist())
+    
+    def arrivals():
+        for arrival in arrival_times:
+            if arrival >= duration:
+                return
+            yield engine.env.timeout(arrival - engine.env.now)
+            job = Job(engine.env.now, "ING")
+            engine.env.process(simpy_server.process_with_backup(job, lambda: next(service_iter)))
+    
+    engine.env.process(arrivals())
+    engine.run(duration)
+    
+    # Serveur inactif sur un moteur remis à zéro (arrivées depuis t=0)
+    engine = _engine(7)
+    native_server = ReliableServer(engine.env, "native", 2, engine.logger,
+                                   SystematicBackup(), lambda: 0.1)
+    native_server.run_native(arrival_times, service_times,
+                             SystematicBackup().backup_mask(150, rng), duration)
+    
+    expected, stats = simpy_server.get_stats(), native_server.get_stats()
+    for key in ('jobs_processed', 'jobs_backed_up'):
+        assert stats[key] == expected[key], f"{key} différent"
+    for key in ('total_backup_time', 'total_service_time'):
+        assert abs(stats[key] - expected[key]) < 1e-9, f"{key} différent"
+    
+    # Comparaison complète sans SimPy
+    engine = _engine(7)
+    comparison = BackupComparison(env=engine.env, logger=engine.logger,
+                                  rng=np.random.default_rng(42))
+    comparison.add_server("random", 2, RandomBackup(0.5), lambda: 0.1)
+    results = comparison.run_comparison(2.0, 3.0, 50.0, native=True)
+    assert 0.3 < results['random']['backup_rate'] < 0.7
+    
+    # Sans générateur: reproductible par la graine du moteur
+    def unseeded_run():
+        engine = _engine(7)
+        comparison = BackupComparison(env=engine.env, logger=engine.logger)
+        comparison.add_server("random", 2, RandomBackup(0.5), lambda: 0.1)
+        return comparison.run_comparison(2.0, 3.0, 50.0, native=True)
+    
+    assert unseeded_run() == unseeded_run(), "Mode natif non reproductible"
+    
+    # Serveur occupé par un job SimPy: refusé
+    engine = _engine(7)
+    busy_server = ReliableServer(engine.env, "busy", 1, engine.logger,
+                                 SystematicBackup(), lambda: 0.1)
+    engine.env.process(busy_server.process_with_backup(Job(0.0, "ING"), lambda: 5.0))
+    engine.env.run(until=1.0)
+    try:
+        busy_server.run_native(arrival_times, service_times,
+                               SystematicBackup().backup_mask(150, rng), duration)
+        assert False, "Serveur occupé accepté"
+    except RuntimeError:
+        pass
+    
+    print(f"  ✓ Mêmes statistiques que SimPy ({stats['jobs_processed']} jobs)")
 
 
 def run_all_tests():
@@ -123,10 +374,18 @@ def run_all_tests():
         print()
         test_random_backup()
         print()
+        test_slotted_objects()
+        print()
         test_reliable_server()
         print()
+        test_interrupted_backup_jobs()
+        print()
         test_backup_comparison()
         print()
+        test_numpy_draws()
+        print()
+        test_native_backup_loop()
+        print()
         
         print("="*60)
         print("  ✓ TOUS LES TESTS RÉUSSIS")